@@ -0,0 +1,190 @@
+import hashlib
+import json
+import os
+import shutil
+import time
+import uuid
+
+# Local directory or a mounted shared folder; an empty value disables the store
+ARTIFACT_STORE_DIR = os.getenv("NEWS_ARTIFACT_STORE", "artifact_store")
+# Least recently used stage results are evicted once the stored files exceed this size
+ARTIFACT_STORE_MAX_BYTES = int(os.getenv("NEWS_ARTIFACT_STORE_MAX_MB", "2048")) * 2 ** 20
+# Files younger than this may belong to a write still in progress on another machine; collect_garbage skips them
+WRITE_GRACE_SECONDS = 60 * 60
+
+def _temp_path(path):
+    # Unique per writer, so machines sharing the folder never write to the same temporary file
+    return f"{path}.tmp-{uuid.uuid4().hex}"
+
+class ArtifactStore:
+    """
+    Content-addressed store of pipeline stage outputs, shared by every run that can reach its directory.
+    Files are stored once under the SHA-256 of their contents (objects/ab/cdef...), and each stage result
+    is recorded under its stage fingerprint (stages/<fingerprint>.json) as output name -> content hash.
+    All writes go to a unique temporary file first and are moved into place atomically.
+    """
+
+    def __init__(self, root=ARTIFACT_STORE_DIR, max_bytes=ARTIFACT_STORE_MAX_BYTES):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.objects_dir = os.path.join(root, "objects")
+        self.stages_dir = os.path.join(root, "stages")
+        os.makedirs(self.objects_dir, exist_ok=True)
+        os.makedirs(self.stages_dir, exist_ok=True)
+
+    def _object_path(self, digest):
+        return os.path.join(self.objects_dir, digest[:2], digest[2:])
+
+    def _entry_path(self, key):
+        return os.path.join(self.stages_dir, f"{key}.json")
+
+    def put_file(self, path):
+        """
+        Stores a file's contents and returns their hash; contents that are already stored are not copied again.
+        """
+        digest = hashlib.sha256()
+        with open(path, "rb") as file:
+            for chunk in iter(lambda: file.read(1 << 20), b""):
+                digest.update(chunk)
+        digest = digest.hexdigest()
+
+        object_path = self._object_path(digest)
+        if os.path.exists(object_path):
+            # Refresh it so collect_garbage cannot remove it before the stage result referring to it is written
+            os.utime(object_path)
+        else:
+            os.makedirs(os.path.dirname(object_path), exist_ok=True)
+            temp_path = _temp_path(object_path)
+            shutil.copyfile(path, temp_path)
+            os.replace(temp_path, object_path)
+        return digest
+
+    def get_file(self, digest, output_path):
+        """
+        Copies stored contents to output_path atomically. Returns False, and drops the stored copy,
+        if the contents no longer match their hash (e.g. a write to the shared folder was cut off).
+        """
+        temp_path = _temp_path(output_path)
+        check = hashlib.sha256()
+        try:
+            with open(self._object_path(digest), "rb") as source, open(temp_path, "wb") as target:
+                for chunk in iter(lambda: source.read(1 << 20), b""):
+                    check.update(chunk)
+                    target.write(chunk)
+        except OSError:
+            # Removed by another machine's collect_garbage in the meantime
+            self._remove(temp_path)
+            return False
+        if check.hexdigest() != digest:
+            self._remove(temp_path)
+            self._remove(self._object_path(digest))
+            return False
+        os.replace(temp_path, output_path)
+        return True
+
+    def publish(self, key, stage_name, outputs):
+        """
+        Stores a stage's output files under its fingerprint. The record is written after the files,
+        so other machines never see a result whose files are missing.
+        """
+        entry = {
+            "stage": stage_name,
+            "outputs": {os.path.basename(path): self.put_file(path) for path in outputs},
+            "created_at": time.strftime("%Y-%m-%d %H:%M:%S")
+        }
+        entry_path = self._entry_path(key)
+        temp_path = _temp_path(entry_path)
+        with open(temp_path, "w", encoding="utf-8") as file:
+            json.dump(entry, file, indent=2)
+        os.replace(temp_path, entry_path)
+
+    def contains(self, key):
+        return os.path.exists(self._entry_path(key))
+
+    def _load_entry(self, key):
+        try:
+            with open(self._entry_path(key), "r", encoding="utf-8") as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return None
+
+    def fetch(self, key, outputs):
+        """
+        Restores a stage's outputs stored under its fingerprint. Returns True only if every output was restored.
+        """
+        entry = self._load_entry(key)
+        if entry is None:
+            return False
+        names = {os.path.basename(path): path for path in outputs}
+        if set(names) != set(entry["outputs"]):
+            return False
+        for name, digest in entry["outputs"].items():
+            if not self.get_file(digest, names[name]):
+                return False
+        # Mark the result as recently used for collect_garbage
+        os.utime(self._entry_path(key))
+        return True
+
+    def _remove(self, path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def collect_garbage(self):
+        """
+        Evicts the least recently used stage results until the stored files fit in max_bytes, then removes
+        files no remaining result refers to and temporary files left by interrupted writes
+        (both only once they are older than WRITE_GRACE_SECONDS).
+        Returns the number of bytes freed.
+        """
+        entries = []
+        for name in os.listdir(self.stages_dir):
+            path = os.path.join(self.stages_dir, name)
+            entry = self._load_entry(name[:-len(".json")]) if name.endswith(".json") else None
+            if entry is not None:
+                entries.append((os.path.getmtime(path), path, set(entry["outputs"].values())))
+
+        references = {}
+        for _, _, digests in entries:
+            for digest in digests:
+                references[digest] = references.get(digest, 0) + 1
+        sizes = {}
+        for digest in references:
+            try:
+                sizes[digest] = os.path.getsize(self._object_path(digest))
+            except OSError:
+                sizes[digest] = 0
+        total = sum(sizes.values())
+
+        for _, path, digests in sorted(entries, key=lambda entry: entry[0]):
+            if total <= self.max_bytes:
+                break
+            self._remove(path)
+            for digest in digests:
+                references[digest] -= 1
+                if references[digest] == 0:
+                    total -= sizes[digest]
+
+        freed = 0
+        now = time.time()
+        for directory, _, files in os.walk(self.root):
+            for name in files:
+                path = os.path.join(directory, name)
+                if ".tmp-" in name:
+                    unused = True
+                elif os.path.dirname(directory) == self.objects_dir:
+                    unused = references.get(os.path.basename(directory) + name, 0) == 0
+                else:
+                    continue
+                try:
+                    if unused and now - os.path.getmtime(path) > WRITE_GRACE_SECONDS:
+                        size = os.path.getsize(path)
+                        os.remove(path)
+                        freed += size
+                except OSError:
+                    # Already removed by another machine
+                    pass
+        if freed:
+            print(f"🧹 Artifact store: freed {freed / 2 ** 20:.1f} MiB")
+        return freed
@@ -0,0 +1,90 @@
+import threading
+
+class PipelineCancelled(Exception):
+    """Raised at the next checkpoint once a run has been cancelled."""
+
+class CancellationToken:
+    """
+    Cancels or pauses a running pipeline from another thread. The stages call checkpoint() between items:
+    it blocks while the token is paused and raises PipelineCancelled once it is cancelled, so requests
+    already in flight always complete. With events from a multiprocessing Manager (see
+    shared_cancellation_token) one token controls every process it is passed to.
+    """
+
+    def __init__(self, cancelled=None, running=None):
+        self._cancelled = threading.Event() if cancelled is None else cancelled
+        self._running = threading.Event() if running is None else running
+        self._running.set()
+        # Tokens that follow this one, e.g. the shared token of a multi-country run
+        self._linked = []
+
+    @property
+    def cancelled(self):
+        return self._cancelled.is_set()
+
+    @property
+    def paused(self):
+        return not self._running.is_set()
+
+    def cancel(self):
+        self._cancelled.set()
+        # Wake paused stages so they see the cancellation
+        self._running.set()
+        for token in list(self._linked):
+            token.cancel()
+
+    def pause(self):
+        self._running.clear()
+        for token in list(self._linked):
+            token.pause()
+
+    def resume(self):
+        self._running.set()
+        for token in list(self._linked):
+            token.resume()
+
+    def link(self, token):
+        """
+        Passes every later cancel, pause and resume on to token, which first takes over this token's state.
+        """
+        if self.cancelled:
+            token.cancel()
+        elif self.paused:
+            token.pause()
+        self._linked.append(token)
+
+    def unlink(self, token):
+        self._linked.remove(token)
+
+    def checkpoint(self):
+        self._running.wait()
+        if self._cancelled.is_set():
+            raise PipelineCancelled("⏹️ Run cancelled")
+
+def shared_cancellation_token(manager):
+    """
+    Creates a CancellationToken whose state lives in a multiprocessing Manager, so it can be passed to worker processes.
+    """
+    return CancellationToken(manager.Event(), manager.Event())
+
+# Token of the run in progress in this process (set by the GUI or a country worker process)
+_token = None
+
+def set_cancellation_token(token):
+    """
+    Makes checkpoint() follow token; None lets runs go uninterrupted.
+    """
+    global _token
+    _token = token
+
+def checkpoint():
+    """
+    Called by the stages between items: waits while the run is paused and raises PipelineCancelled once it is cancelled.
+    """
+    token = _token
+    if token is not None:
+        token.checkpoint()
+
+def is_paused():
+    token = _token
+    return token is not None and token.paused
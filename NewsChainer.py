@@ -2,8 +2,8 @@ import pandas as pd
 import itertools
 import re
 from collections import defaultdict
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+from NewsCancellation import checkpoint
+from NewsProgress import ProgressTracker
 
 def preprocess_text(text):
     """
@@ -18,6 +18,7 @@ def extract_keywords(text, num_keywords=5):
     Extracts key terms from the article using TF-IDF vectorization.
     Returns a set of top `num_keywords` important words from the text.
     """
+    from sklearn.feature_extraction.text import TfidfVectorizer  # Deferred: sklearn is slow to import
     vectorizer = TfidfVectorizer(stop_words="english", max_features=1000)
     tfidf_matrix = vectorizer.fit_transform([text])
     feature_array = vectorizer.get_feature_names_out()
@@ -47,12 +48,17 @@ def find_related_articles(articles_df, similarity_threshold=0.2):
     article_index_map = {i: row for i, row in articles_df.iterrows()}
     
     # Compute similarity between articles
+    from sklearn.feature_extraction.text import TfidfVectorizer
+    from sklearn.metrics.pairwise import cosine_similarity
     vectorizer = TfidfVectorizer(stop_words="english", max_features=1000)
     tfidf_matrix = vectorizer.fit_transform(articles_df["Processed_Content"])
     similarity_matrix = cosine_similarity(tfidf_matrix)
 
     # Group related articles
+    progress = ProgressTracker("chain", len(articles_df), "articles")
     for i, row in articles_df.iterrows():
+        checkpoint()
+        progress.advance()
         if i in used_articles:
             continue
 
@@ -66,6 +72,7 @@ def find_related_articles(articles_df, similarity_threshold=0.2):
 
         grouped_articles.append(group)
 
+    progress.finish()
     return grouped_articles, article_index_map
 
 def format_chained_articles(grouped_articles, article_index_map):
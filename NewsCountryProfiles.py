@@ -0,0 +1,88 @@
+import json
+import os
+from dataclasses import dataclass, field
+from functools import lru_cache
+
+# One JSON file per country; adding a country only needs a new profile file
+PROFILE_DIR = os.getenv("NEWS_COUNTRY_PROFILES", os.path.join(os.path.dirname(os.path.abspath(__file__)), "country_profiles"))
+DEFAULT_COUNTRY = "Sweden"
+
+# Prompts a profile may override under "prompts"
+DEFAULT_PROMPTS = {
+    "summary_system": (
+        "You are a professional news summariser writing in British English and past tense. "
+        "Your summaries must always be fully complete and must never be cut off."
+    ),
+    "headline_system": "You are an expert news summariser writing in British English.",
+    "categorisation_system": "You are an expert news categorizer ensuring accurate classification of news stories."
+}
+
+# Pipeline file names; {tag} is the profile's file_tag and {name} its display name.
+# A profile may override any of them under "files".
+DEFAULT_FILE_NAMES = {
+    "extracted_csv": "extracted_news_{tag}.csv",
+    "extracted_xlsx": "extracted_news_{tag}.xlsx",
+    "chained_csv": "chained_news_{tag}.csv",
+    "merged_csv": "merged_stories_{tag}.csv",
+    "merged_xlsx": "merged_stories_{tag}.xlsx",
+    "summarised_csv": "summarised_stories_{tag}.csv",
+    "summarised_xlsx": "summarised_stories_{tag}.xlsx",
+    "digest_md": "Monthly_News_Digest_{name}.md",
+    "digest_docx": "Monthly_News_Digest_{name}.docx",
+    "digest_html": "Monthly_News_Digest_{name}.html",
+    "digest_txt": "Monthly_News_Digest_{name}.txt",
+    "digest_json": "digest_document_{tag}.json",
+    "llm_report": "llm_run_report_{tag}.json",
+    "label_store": "LabelStore_{tag}.csv",
+    "pipeline_manifest": "pipeline_manifest_{tag}.json"
+}
+
+@dataclass
+class CountryProfile:
+    """
+    Everything that differs between countries: categories and their keywords, the final report
+    categories and their order, prompt wording, the Word title and file naming.
+    """
+    name: str
+    file_tag: str
+    categories: dict
+    llm_categories: list
+    category_order: list
+    docx_title: str = "Mundus Prime\nMonthly News Digest"
+    prompts: dict = field(default_factory=dict)
+    files: dict = field(default_factory=dict)
+
+    def prompt(self, key):
+        return self.prompts.get(key, DEFAULT_PROMPTS[key])
+
+    def file_name(self, key):
+        return self.files.get(key, DEFAULT_FILE_NAMES[key]).format(tag=self.file_tag, name=self.name)
+
+def available_countries(profile_dir=PROFILE_DIR):
+    """
+    Display names of the countries with a profile file, sorted with the default country first.
+    """
+    names = [load_profile(os.path.splitext(file)[0], profile_dir).name
+             for file in os.listdir(profile_dir) if file.endswith(".json")]
+    return sorted(names, key=lambda name: (name != DEFAULT_COUNTRY, name))
+
+@lru_cache(maxsize=None)
+def load_profile(country=DEFAULT_COUNTRY, profile_dir=PROFILE_DIR):
+    """
+    Loads a country profile by name (case-insensitive), reading each file only once per process.
+    """
+    path = os.path.join(profile_dir, f"{country.lower()}.json")
+    if not os.path.exists(path):
+        raise ValueError(f"❌ No country profile for {country} (expected {path})")
+    with open(path, "r", encoding="utf-8") as file:
+        data = json.load(file)
+    data.setdefault("file_tag", country.lower())
+    return CountryProfile(**data)
+
+def resolve_profile(profile):
+    """
+    Accepts a CountryProfile, a country name or None (the default country).
+    """
+    if isinstance(profile, CountryProfile):
+        return profile
+    return load_profile(profile or DEFAULT_COUNTRY)
@@ -1,46 +1,43 @@
 import pandas as pd
 import os
 import re
+import json
 import numpy as np
-from sklearn.feature_extraction.text import TfidfVectorizer, CountVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
-from sklearn.naive_bayes import MultinomialNB
-from sklearn.pipeline import make_pipeline
-from docx import Document
-from docx.shared import Pt
-from docx.enum.text import WD_PARAGRAPH_ALIGNMENT
-from docx.oxml import OxmlElement
-from docx.oxml.ns import qn
-import openai
-from dotenv import load_dotenv
-
-# Load OpenAI API key from .env file
-load_dotenv()
-OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
-
-if not OPENAI_API_KEY:
-    raise ValueError("❌ OpenAI API key is missing! Check your .env file.")
-
-# OpenAI client setup
-client = openai.OpenAI(api_key=OPENAI_API_KEY)
-
-# Category definitions
-categories = {
-    "Security & Defence": ["NATO", "military", "war", "defence", "Swedish Armed Forces", "cyberattack", "intelligence"],
-    "Foreign Relations & International Aid": ["UN", "international", "diplomacy", "foreign policy", "aid", "embassy"],
-    "Sweden in the EU": ["EU", "European Union", "Brussels", "regulation", "directive"],
-    "Domestic News": ["Swedish government", "Riksdag", "policy", "social", "healthcare", "education"],
-    "Law & Order": ["crime", "police", "justice", "court", "gangs", "law"],
-    "Education & Research": ["university", "research", "education", "students", "school"],
-    "Energy": ["nuclear", "wind power", "energy policy", "electricity", "power grid"],
-    "Climate & The Green Transition": ["emissions", "climate change", "green technology", "sustainability"],
-    "Business News & Economy": ["economy", "inflation", "GDP", "business", "market", "finance"],
-    "Sweden's Economic Trends": ["economic trends", "GDP growth", "Riksbank", "inflation", "monetary policy"],
-    "Business News: Key Developments": ["business developments", "corporate news", "mergers", "acquisitions", "market trends"],
-    "Green Industry": ["renewable energy", "sustainability", "green investments", "carbon neutral", "eco-friendly"],
-    "Reporting Season": ["earnings reports", "financial results", "quarterly earnings", "stock performance", "revenue projections"],
-    "Copyright & Disclaimer": ["copyright", "disclaimer", "terms and conditions", "legal", "intellectual property"]
-}
+from scipy.sparse import csr_matrix
+from NewsTelemetry import record_stat, timed_completion
+from NewsPrompts import MAX_ARTICLE_CHARS, cap_text, category_max_tokens, log_compaction, strip_markdown
+from NewsModelCache import MODEL_CACHE_DIR, fingerprint_training, get_model, save_cached_model
+from NewsNBScorer import NaiveBayesScorer
+from NewsFeatures import DigestFeatures
+from NewsKeywordMatcher import get_keyword_matcher
+from NewsCountryProfiles import resolve_profile
+from NewsCancellation import checkpoint
+from NewsProgress import ProgressTracker
+from NewsDocumentModel import build_digest_document, render_markdown
+from NewsTrainingStore import append_labels, format_escalation_trend, metrics_path_for, record_escalation_share
+
+# OpenAI client for the escalated stories; created by get_client only when a run needs the LLM
+client = None
+
+def get_client():
+    """
+    Returns the OpenAI client, loading openai and the API key (environment or .env file) on first use.
+    """
+    global client
+    if client is None:
+        import openai
+        from dotenv import load_dotenv
+        load_dotenv()
+        api_key = os.getenv("OPENAI_API_KEY")
+        if not api_key:
+            raise ValueError("❌ OpenAI API key is missing! Check your .env file.")
+        client = openai.OpenAI(api_key=api_key)
+    return client
+
+# Escalation policy: only low-margin stories are sent to the LLM
+ESCALATION_CONFIDENCE = 0.8      # Naïve Bayes probability below which a story is escalated
+ESCALATION_MARGIN = 0.15         # Relative gap between the two best category similarities
+LLM_BATCH_SIZE = 20              # Summaries categorised per batched LLM request
 
 # List of months to exclude from bolding
 EXCLUDED_WORDS = {
@@ -53,9 +50,28 @@ def preprocess_text(text):
     text = re.sub(r"[^\w\s]", "", text.lower())
     return text
 
+# Below this Naïve Bayes probability a story is filed under "Miscellaneous"
+ML_CONFIDENCE_THRESHOLD = 0.6
+
+# "sparse" refines categories from per-category aggregates of the sparse TF-IDF matrix (bounded memory);
+# "dense" builds the full N×N similarity matrix as before
+SIMILARITY_MODE = "sparse"
+
+# Classifier hyperparameters; part of the model cache fingerprint
+CLASSIFIER_PARAMS = {"ngram_range": (1, 2), "alpha": 1.0}
+
+def preprocess_series(texts):
+    """Vectorised preprocess_text over a whole pandas Series."""
+    return texts.astype(str).str.lower().str.replace(r"[^\w\s]", "", regex=True)
+
 def train_classifier(training_files):
-    """Trains a Naïve Bayes classifier using multiple labeled datasets."""
-    dataframes = [pd.read_excel(file) for file in training_files]
+    """Trains a Naïve Bayes classifier using multiple labeled datasets (Excel files or the CSV label store)."""
+    # scikit-learn is only needed when (re)training; cached runs score with NaiveBayesScorer
+    from sklearn.feature_extraction.text import CountVectorizer
+    from sklearn.naive_bayes import MultinomialNB
+    from sklearn.pipeline import make_pipeline
+
+    dataframes = [pd.read_csv(file) if file.endswith(".csv") else pd.read_excel(file) for file in training_files]
     df = pd.concat(dataframes, ignore_index=True)
     
     if "Category" not in df.columns:
@@ -64,10 +80,57 @@ def train_classifier(training_files):
     df["Processed"] = df["Summary"].apply(preprocess_text)
     X = df["Processed"]
     y = df["Category"]
-    classifier = make_pipeline(CountVectorizer(ngram_range=(1,2)), MultinomialNB())
+    classifier = make_pipeline(
+        CountVectorizer(ngram_range=CLASSIFIER_PARAMS["ngram_range"]),
+        MultinomialNB(alpha=CLASSIFIER_PARAMS["alpha"])
+    )
     classifier.fit(X, y)
     return classifier
 
+def scorer_path_for(name, cache_dir=MODEL_CACHE_DIR):
+    """Path of the exported NumPy scorer artifact for a cached classifier."""
+    return os.path.join(cache_dir, f"{name}.npz")
+
+def export_scorer(classifier, fingerprint, name, cache_dir=MODEL_CACHE_DIR):
+    """Exports a fitted pipeline to the NumPy scorer artifact, tagged with its training fingerprint."""
+    NaiveBayesScorer.from_pipeline(classifier, fingerprint).save(scorer_path_for(name, cache_dir))
+
+def load_classifier(training_files, cache_dir=MODEL_CACHE_DIR, name="classifier"):
+    """
+    Loads the classifier for the given training data without importing scikit-learn when the
+    exported NumPy scorer is current; otherwise falls back to the pickled pipeline model cache,
+    which (re)trains via train_classifier and re-exports the scorer.
+    Returns (classifier, current); current is False when the classifier is an older model in use
+    while it is retrained on the changed training data in the background.
+    """
+    fingerprint = fingerprint_training(training_files, CLASSIFIER_PARAMS)
+    scorer = NaiveBayesScorer.load(scorer_path_for(name, cache_dir))
+    if scorer is not None and scorer.fingerprint == fingerprint:
+        print(f"⚡ Loaded NumPy scorer for {name}")
+        return scorer, True
+
+    return get_model(
+        train_classifier, training_files, CLASSIFIER_PARAMS, name, cache_dir,
+        on_save=lambda model, model_fingerprint: export_scorer(model, model_fingerprint, name, cache_dir)
+    )
+
+def update_classifier(classifier, summaries, labels):
+    """
+    Incrementally updates the Naïve Bayes step with new labelled summaries via partial_fit,
+    using the existing vocabulary. Labels the model has never seen cannot be learnt incrementally
+    and are skipped. Returns True if every label was learnt.
+    """
+    if isinstance(classifier, NaiveBayesScorer):
+        return classifier.partial_fit(preprocess_series(pd.Series(summaries)), labels)
+
+    vectorizer, model = classifier.steps[0][1], classifier.steps[-1][1]
+    labels = np.asarray(labels, dtype=object)
+    known = np.isin(labels, model.classes_)
+    if known.any():
+        features = vectorizer.transform(preprocess_series(pd.Series(summaries)[known]))
+        model.partial_fit(features, labels[known])
+    return bool(known.all())
+
 def categorize_story_ml(classifier, summary):
     """Uses trained classifier to categorize summaries with confidence filtering."""
     processed_text = preprocess_text(summary)
@@ -75,51 +138,71 @@ def categorize_story_ml(classifier, summary):
     max_prob = max(probabilities)
     predicted_category = classifier.classes_[np.argmax(probabilities)]
     
-    if max_prob < 0.6:  # Threshold for confidence filtering
+    if max_prob < ML_CONFIDENCE_THRESHOLD:  # Threshold for confidence filtering
         return "Miscellaneous"
     return predicted_category
 
-def compute_similarity(stories):
+def predict_proba_from_features(classifier, features):
+    """Class probabilities from the digest run's shared n-gram counts, without re-tokenising the summaries."""
+    if isinstance(classifier, NaiveBayesScorer):
+        return classifier.predict_proba_counts(features.counts_for(classifier.vocabulary, len(classifier.terms)))
+    vectorizer, model = classifier.steps[0][1], classifier.steps[-1][1]
+    return model.predict_proba(features.counts_for(vectorizer.vocabulary_, len(vectorizer.vocabulary_)))
+
+def categorize_stories_ml(classifier, summaries, features=None):
+    """
+    Batch version of categorize_story_ml: preprocesses all summaries at once, calls predict_proba once
+    and applies the confidence threshold with NumPy. When the run's DigestFeatures are given, the
+    classifier input is taken from their n-gram counts instead.
+    Returns (categories, confidences) as arrays aligned with summaries.
+    """
+    if len(summaries) == 0:
+        return np.array([], dtype=object), np.array([], dtype=float)
+
+    if features is not None:
+        probabilities = predict_proba_from_features(classifier, features)
+    else:
+        probabilities = classifier.predict_proba(preprocess_series(pd.Series(summaries)))
+    best = probabilities.argmax(axis=1)
+    confidences = probabilities[np.arange(len(best)), best]
+    categories = np.where(confidences < ML_CONFIDENCE_THRESHOLD, "Miscellaneous", classifier.classes_[best].astype(object))
+    return categories.astype(object), confidences
+
+def compute_similarity(stories, features=None):
     """Computes similarity scores and refines category assignments."""
+    if features is not None:
+        return features.similarity()
+
+    from sklearn.feature_extraction.text import TfidfVectorizer
+    from sklearn.metrics.pairwise import cosine_similarity
+
     vectorizer = TfidfVectorizer(ngram_range=(1,2))
     tfidf_matrix = vectorizer.fit_transform(stories)
     similarity_matrix = cosine_similarity(tfidf_matrix)
     return similarity_matrix
 
-def categorize_with_llm(summary, initial_category):
+def categorize_with_llm(summary, initial_category, story_group=None, profile=None):
     """
     Uses GPT-4-turbo to refine the category of a news summary.
-    Takes in the second-stage categorization's assigned category and evaluates whether it fits the final report categories.
-    """
-    categories_list = [
-        "Security & Defence",
-        "Foreign Relations & International Aid",
-        "Sweden in the EU",
-        "Domestic News",
-        "Law & Order",
-        "Education & Research",
-        "Climate & The Green Transition",
-        "Energy",
-        "Sweden's Economic Trends",
-        "Business News: Key Developments",
-        "Green Industry",
-        "Reporting Season"
-    ]
+    Takes in the second-stage categorization's assigned category and evaluates whether it fits the country profile's final report categories.
+    """
+    profile = resolve_profile(profile)
+    compacted_summary = cap_text(strip_markdown(str(summary)), MAX_ARTICLE_CHARS)
+    log_compaction("categorisation", story_group, str(summary), compacted_summary)
 
     try:
-        client = openai.OpenAI()  # ✅ Initialize OpenAI client
-        
-        response = client.chat.completions.create(  # ✅ Correct OpenAI call
+        response = timed_completion(  # ✅ Reuses the shared client, timed for the run report
+            get_client(), "categorisation", story_group,
             model="gpt-4-turbo",
             messages=[
-                {"role": "system", "content": "You are an expert news categorizer ensuring accurate classification of news stories."},
-                {"role": "user", "content": f"Here is a news summary:\n\n{summary}\n\n"
+                {"role": "system", "content": profile.prompt("categorisation_system")},
+                {"role": "user", "content": f"Here is a news summary:\n\n{compacted_summary}\n\n"
                                              f"The machine learning system initially classified it as: {initial_category}.\n"
-                                             f"Choose the most appropriate category from this list: {', '.join(categories_list)}.\n"
+                                             f"Choose the most appropriate category from this list: {', '.join(profile.llm_categories)}.\n"
                                              f"Reply ONLY with the category name, without explanation."}
             ],
             temperature=0.2,
-            max_tokens=2000
+            max_tokens=category_max_tokens(profile.llm_categories)  # Only a category name is expected back
         )
         # ✅ Correct way to access the response (as an object)
         return response.choices[0].message.content.strip()
@@ -128,79 +211,215 @@ def categorize_with_llm(summary, initial_category):
         print(f"⚠️ Error in LLM categorization: {e}")
         return initial_category  # Fallback to the ML-assigned category
 
-def refine_category_assignment(df):
+def categorize_batch_with_llm(items, story_groups=None, profile=None):
+    """
+    Categorises many summaries in one GPT-4-turbo request.
+    items is a list of (summary, initial_category); the model answers with a JSON object mapping each
+    item index to a category. Missing or unknown answers fall back to the initial category.
+    Returns (categories, answered) where answered flags the categories the LLM actually decided.
+    """
+    profile = resolve_profile(profile)
+    summaries = [str(summary) for summary, _ in items]
+    compacted = [cap_text(strip_markdown(summary), MAX_ARTICLE_CHARS) for summary in summaries]
+    batch_label = f"{story_groups[0]}-{story_groups[-1]}" if story_groups else f"batch of {len(items)}"
+    log_compaction("categorisation", batch_label, "".join(summaries), "".join(compacted))
+
+    numbered = "\n\n".join(
+        f"[{i}] (initially: {initial_category}) {summary}"
+        for i, (summary, (_, initial_category)) in enumerate(zip(compacted, items))
+    )
+    fallback = [initial_category for _, initial_category in items]
+
+    try:
+        response = timed_completion(
+            get_client(), "categorisation", story_groups,
+            model="gpt-4-turbo",
+            messages=[
+                {"role": "system", "content": profile.prompt("categorisation_system")},
+                {"role": "user", "content": f"Here are {len(items)} numbered news summaries, each with the category the machine learning system initially chose:\n\n"
+                                             f"{numbered}\n\n"
+                                             f"For each summary choose the most appropriate category from this list: {', '.join(profile.llm_categories)}.\n"
+                                             f"Reply ONLY with a JSON object mapping each summary number to its category name, "
+                                             f"for example {{\"0\": \"{profile.llm_categories[0]}\"}}."}
+            ],
+            temperature=0.2,
+            max_tokens=(category_max_tokens(profile.llm_categories) + 5) * len(items) + 20,
+            response_format={"type": "json_object"}
+        )
+        answers = json.loads(response.choices[0].message.content)
+    except Exception as e:
+        print(f"⚠️ Error in batched LLM categorization: {e}")
+        return fallback, [False] * len(items)
+
+    refined, answered = [], []
+    for i, initial_category in enumerate(fallback):
+        answer = str(answers.get(str(i), "")).strip()
+        answered.append(answer in profile.llm_categories)
+        refined.append(answer if answer in profile.llm_categories else initial_category)
+    return refined, answered
+
+def needs_llm_review(ml_category, refined_category, ml_confidence, similarity_margin, keyword_category=None, llm_categories=None):
+    """
+    Escalation policy: a story goes to the LLM only when the classifier and the similarity
+    refinement disagree, either of them is unsure, or the category is not a final report category.
+    A clear-cut keyword match that agrees with the refined category skips the LLM.
+    """
+    if refined_category not in (llm_categories or resolve_profile(None).llm_categories):
+        return True
+    if keyword_category == refined_category:
+        return False
+    return (
+        ml_category != refined_category
+        or ml_confidence < ESCALATION_CONFIDENCE
+        or similarity_margin < ESCALATION_MARGIN
+    )
+
+def category_mean_similarity(similarities, assigned, category_names):
+    """
+    Returns an N×C matrix holding each story's mean similarity to the stories assigned to each category,
+    computed for all rows at once as similarities @ one-hot(category). Empty categories score 0.
+    """
+    codes = pd.Categorical(assigned, categories=category_names).codes
+    rows = np.flatnonzero(codes >= 0)
+    one_hot = csr_matrix((np.ones(len(rows)), (rows, codes[rows])), shape=(len(codes), len(category_names)))
+    counts = np.asarray(one_hot.sum(axis=0)).ravel()
+    sums = np.asarray(one_hot.T @ np.asarray(similarities).T).T
+    return np.divide(sums, counts, out=np.zeros_like(sums, dtype=float), where=counts > 0)
+
+def refine_categories(similarities, assigned, category_names, means=None):
+    """
+    Moves each story to the category it is most similar to on average (first category wins ties).
+    Stories with no positive similarity to any category keep their assigned category.
+    The per-category means may be passed in precomputed, in which case similarities is not used.
+    Returns (refined categories, relative margin between the best and second-best category).
+    """
+    assigned = np.asarray(assigned, dtype=object)
+    if means is None:
+        means = category_mean_similarity(similarities, assigned, category_names)
+    best = means.argmax(axis=1)
+    best_scores = means[np.arange(len(best)), best]
+    second_scores = np.sort(means, axis=1)[:, -2] if means.shape[1] > 1 else np.zeros(len(best))
+    margins = np.divide(best_scores - second_scores, best_scores, out=np.zeros_like(best_scores), where=best_scores > 0)
+    return np.where(best_scores > 0, np.asarray(category_names, dtype=object)[best], assigned), margins
+
+def refine_category_assignment(df, features=None, profile=None):
     """Adjusts categorization based on similarity scores."""
-    similarities = compute_similarity(df["Summary"])
-    for idx, row in df.iterrows():
-        best_fit_category = row["Category"]
-        best_score = 0
-        for category in categories.keys():
-            category_indices = df[df["Category"] == category].index
-            if not category_indices.empty:
-                avg_similarity = np.mean(similarities[idx, category_indices])
-                if avg_similarity > best_score:
-                    best_score = avg_similarity
-                    best_fit_category = category
-        df.at[idx, "Refined Category"] = best_fit_category
-        
-         # Apply LLM refinement to finalize category
-        final_category = categorize_with_llm(row["Summary"], best_fit_category)
-        df.at[idx, "Refined Category"] = final_category
-        
+    profile = resolve_profile(profile)
+    category_names = list(profile.categories.keys())
+    if features is not None and SIMILARITY_MODE == "sparse":
+        # Never builds the N×N matrix: only the N×C category aggregates
+        means = features.category_mean_similarity(df["Category"], category_names)
+        df["Refined Category"], df["Similarity Margin"] = refine_categories(None, df["Category"], category_names, means)
+    else:
+        similarities = compute_similarity(df["Summary"], features)
+        df["Refined Category"], df["Similarity Margin"] = refine_categories(similarities, df["Category"], category_names)
+
+    # Cheap first pass: keyword lists from the categories dict, matched in one pass per summary
+    df["Keyword Category"] = get_keyword_matcher(profile.categories).clear_winners(df["Summary"])
+
+    # Only escalate low-margin stories to the LLM
+    ml_confidence = df["ML Confidence"] if "ML Confidence" in df.columns else pd.Series(0.0, index=df.index)
+    signals = list(zip(df["Category"], df["Refined Category"], ml_confidence, df["Similarity Margin"]))
+    escalate = [
+        needs_llm_review(*signal, keyword_category, profile.llm_categories)
+        for signal, keyword_category in zip(signals, df["Keyword Category"])
+    ]
+    keyword_skips = sum(needs_llm_review(*signal, None, profile.llm_categories) and not escalated for signal, escalated in zip(signals, escalate))
+    record_stat("categorisation", "keyword_skips", keyword_skips)
+    escalated = df.index[escalate]
+    df["Escalated"] = escalate
+    df["LLM Confirmed"] = False
+
+    # Apply batched LLM refinement to finalize the escalated categories
+    llm_calls = 0
+    if len(escalated):
+        get_client()  # A missing API key stops the stage here instead of silently keeping every ML category
+    progress = ProgressTracker("digest", len(escalated), "escalated stories")
+    for start in range(0, len(escalated), LLM_BATCH_SIZE):
+        checkpoint()
+        batch = escalated[start:start + LLM_BATCH_SIZE]
+        items = list(zip(df.loc[batch, "Summary"], df.loc[batch, "Refined Category"]))
+        story_groups = list(df.loc[batch, "Story Group ID"]) if "Story Group ID" in df.columns else list(batch)
+        df.loc[batch, "Refined Category"], df.loc[batch, "LLM Confirmed"] = categorize_batch_with_llm(items, story_groups, profile)
+        llm_calls += 1
+        progress.advance(len(batch))
+    progress.finish()
+
+    report_escalation(len(df), len(escalated), llm_calls)
     return df
 
-def generate_monthly_digest(input_excel, output_md, training_files):
+def report_escalation(total, escalated, llm_calls):
+    """Prints and records how many stories were escalated and how many LLM calls that saved."""
+    escalation_rate = escalated / total if total else 0.0
+    calls_saved = total - llm_calls  # Previously one LLM call per story
+    record_stat("categorisation", "stories", total)
+    record_stat("categorisation", "escalated", escalated)
+    record_stat("categorisation", "escalation_rate", round(escalation_rate, 3))
+    record_stat("categorisation", "llm_calls", llm_calls)
+    record_stat("categorisation", "llm_calls_saved", calls_saved)
+    print(f"🧭 LLM categorisation: escalated {escalated}/{total} stories ({escalation_rate:.0%}) "
+          f"in {llm_calls} batched calls; {calls_saved} LLM calls saved")
+
+def learn_from_llm_labels(df, classifier, training_files, label_store, model_name, current=True, month=None):
+    """
+    Active learning: appends the LLM-confirmed categories to the label store, updates the classifier
+    incrementally, and tracks the escalation share of the digest month ("2025-02"; not recorded when unknown).
+    The incremental update keeps the old vocabulary, so it is cached as stale: the next run uses it
+    while a full retrain on the label store runs in the background. It is skipped when the classifier
+    is already an older model awaiting that retrain, or when stored labels changed.
+    """
+    confirmed = df[df["LLM Confirmed"]]
+    added, relabelled = append_labels(label_store, confirmed["Summary"], confirmed["Refined Category"], "llm")
+    print(f"📚 Added {len(added)} LLM-confirmed labels to {label_store}"
+          + (f" ({relabelled} stored labels changed)" if relabelled else ""))
+
+    if not current:
+        print("⏳ Classifier is being retrained on the changed training data; it will learn the new labels from the label store")
+    elif relabelled:
+        print("🔁 Stored labels changed; the classifier is retrained from the label store on the next run")
+    elif len(added) and update_classifier(classifier, added["Summary"], added["Category"]):
+        # Marked as incremental so the fingerprint never matches: the next run still schedules the
+        # full retrain that learns n-grams only found in the new labels
+        training_files = training_files + [label_store]
+        fingerprint = f"{fingerprint_training(training_files, CLASSIFIER_PARAMS)}+incremental"
+        if isinstance(classifier, NaiveBayesScorer):
+            classifier.fingerprint = fingerprint
+            classifier.save(scorer_path_for(model_name))
+        else:
+            save_cached_model(classifier, fingerprint, model_name, MODEL_CACHE_DIR, training_files)
+            export_scorer(classifier, fingerprint, model_name)
+
+    if not month:
+        print("⚠️ Digest month unknown; LLM escalation share not recorded")
+        return
+    history = record_escalation_share(metrics_path_for(label_store), len(df), int(df["Escalated"].sum()), month)
+    print(f"📉 LLM escalation share by month: {format_escalation_trend(history)}")
+
+def generate_monthly_digest(input_excel, output_md, training_files, label_store=None, profile=None, month=None):
+    """
+    Categorises the summarised stories and writes the Markdown digest; returns the DigestDocument.
+    month ("2025-02") is the digest month the LLM escalation share is recorded under.
+    """
+    profile = resolve_profile(profile)
     df = pd.read_excel(input_excel)
-    classifier = train_classifier(training_files)
-    df["Category"] = df["Summary"].apply(lambda x: categorize_story_ml(classifier, x))
-    df = refine_category_assignment(df)
-    
-    # Initialize digest sections without category labels in stories
-    digest_sections = {category: [] for category in categories.keys()}
-    digest_sections["Miscellaneous"] = []
-    
-    # Add stories without category headlines
-    for _, row in df.iterrows():
-        formatted_story = f"{row['Summary']}\n"
-        digest_sections[row["Refined Category"]].append(formatted_story)
-    
-    # Define the fixed category order
-    category_order = [
-        "Security & Defence",
-        "Foreign Relations & International Aid",
-        "Sweden in the EU",
-        "Domestic News",
-        "Law & Order",
-        "Education & Research",
-        "Energy",
-        "Climate & The Green Transition",
-        "Business News & Economy",
-        "Sweden's Economic Trends",
-        "Business News: Key Developments",
-        "Green Industry",
-        "Reporting Season",
-        "Copyright & Disclaimer"
-    ]
+    # LLM-confirmed labels from earlier runs are part of the training data
+    model_name = "classifier"
+    if label_store:
+        model_name = f"classifier_{os.path.splitext(os.path.basename(label_store))[0]}"
+        if os.path.exists(label_store):
+            training_files = training_files + [label_store]
+    classifier, current = load_classifier(training_files, name=model_name)
+    # Tokenise and count n-grams once for both the classifier and the similarity refinement
+    features = DigestFeatures(preprocess_series(df["Summary"]), CLASSIFIER_PARAMS["ngram_range"])
+    df["Category"], df["ML Confidence"] = categorize_stories_ml(classifier, df["Summary"], features)
+    df = refine_category_assignment(df, features, profile)
+    if label_store:
+        learn_from_llm_labels(df, classifier, [f for f in training_files if f != label_store], label_store, model_name, current, month)
     
-    # Write to markdown file with sorted stories within each category
-    with open(output_md, "w", encoding="utf-8") as md_file:
-        md_file.write("# News\n\n")
-        
-        # Process categories in fixed order
-        for category in category_order:
-            if category in digest_sections and digest_sections[category]:
-                md_file.write(f"## {category}\n\n")
-                
-                # Sort stories within category by length in descending order
-                sorted_stories = sorted(
-                    digest_sections[category],
-                    key=len,
-                    reverse=True
-                )
-                
-                # Write sorted stories
-                for story in sorted_stories:
-                    md_file.write(story + "\n")
+    # Build the digest once in memory; every output format is rendered from this model
+    document = build_digest_document(df["Summary"], df["Refined Category"], profile)
+    render_markdown(document, output_md)
+    return document
 
 def main():
     """
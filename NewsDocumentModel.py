@@ -0,0 +1,158 @@
+import html
+import json
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from NewsCountryProfiles import resolve_profile
+from NewsCancellation import checkpoint
+from NewsProgress import ProgressTracker
+
+BOLD_PATTERN = re.compile(r"\*\*(.*?)\*\*")
+
+@dataclass
+class DigestSection:
+    """One category of the digest with its stories, in reading order."""
+    title: str
+    stories: list = field(default_factory=list)
+
+@dataclass
+class DigestDocument:
+    """
+    In-memory digest produced by generate_monthly_digest: a heading, the country profile it was
+    built with and its non-empty sections in the profile's category order.
+    Story texts keep Markdown **bold** markers; renderers translate them.
+    """
+    heading: str
+    profile: object
+    sections: list = field(default_factory=list)
+
+    def blocks(self):
+        """
+        Yields (level, text) blocks: 1 for the digest heading, 2 for section titles, 0 for stories.
+        """
+        yield 1, self.heading
+        for section in self.sections:
+            yield 2, section.title
+            for story in section.stories:
+                yield 0, story
+
+    def story_count(self):
+        return sum(len(section.stories) for section in self.sections)
+
+def build_digest_document(summaries, categories, profile, heading="News"):
+    """
+    Groups summaries by category into sections following profile.category_order, with stories sorted
+    by length in descending order (ties keep their input order). Categories outside the order are left out.
+    """
+    by_category = {}
+    for summary, category in zip(summaries, categories):
+        by_category.setdefault(category, []).append(str(summary))
+    sections = [
+        DigestSection(category, sorted(by_category[category], key=len, reverse=True))
+        for category in profile.category_order if by_category.get(category)
+    ]
+    return DigestDocument(heading, profile, sections)
+
+def _atomic_write_text(path, text):
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as file:
+        file.write(text)
+    os.replace(temp_path, path)
+
+def render_markdown(document, output_path, **options):
+    """Writes the digest as Markdown, in the layout the digest has always used."""
+    parts = [f"# {document.heading}\n\n"]
+    for section in document.sections:
+        parts.append(f"## {section.title}\n\n")
+        parts.extend(f"{story}\n\n" for story in section.stories)
+    _atomic_write_text(output_path, "".join(parts))
+
+def render_html(document, output_path, **options):
+    """Writes a standalone HTML page (e.g. for the intranet), with **bold** as <strong>."""
+    def paragraph(text):
+        return BOLD_PATTERN.sub(r"<strong>\1</strong>", html.escape(text))
+
+    title = html.escape(document.profile.docx_title.replace("\n", " "))
+    parts = [
+        "<!DOCTYPE html>\n<html lang=\"en\">\n<head>\n<meta charset=\"utf-8\">\n",
+        f"<title>{title}</title>\n</head>\n<body>\n<h1>{html.escape(document.heading)}</h1>\n"
+    ]
+    for section in document.sections:
+        parts.append(f"<h2>{html.escape(section.title)}</h2>\n")
+        parts.extend(f"<p>{paragraph(story)}</p>\n" for story in section.stories)
+    parts.append("</body>\n</html>\n")
+    _atomic_write_text(output_path, "".join(parts))
+
+def render_text(document, output_path, **options):
+    """Writes a plain-text digest (e.g. for email), with underlined headings and no Markdown markers."""
+    def underline(text, char):
+        return f"{text}\n{char * len(text)}\n\n"
+
+    parts = [underline(document.heading.upper(), "=")]
+    for section in document.sections:
+        parts.append(underline(section.title, "-"))
+        parts.extend(BOLD_PATTERN.sub(r"\1", story) + "\n\n" for story in section.stories)
+    _atomic_write_text(output_path, "".join(parts))
+
+def render_json(document, output_path, **options):
+    """Saves the document model itself (profile by name) so it can be rendered again without the digest step."""
+    data = {
+        "heading": document.heading,
+        "profile": document.profile.name,
+        "sections": [{"title": section.title, "stories": section.stories} for section in document.sections]
+    }
+    _atomic_write_text(output_path, json.dumps(data, ensure_ascii=False, indent=2))
+
+def load_document(path, profile=None):
+    """Loads a document saved by render_json; profile defaults to the one it was built with."""
+    with open(path, "r", encoding="utf-8") as file:
+        data = json.load(file)
+    sections = [DigestSection(section["title"], section["stories"]) for section in data["sections"]]
+    return DigestDocument(data["heading"], resolve_profile(profile or data["profile"]), sections)
+
+def render_docx(document, output_path, logo_path="Mundus_Icon.png", template_path=None, **options):
+    """Writes the styled Word digest straight from the document's blocks; large digests are streamed."""
+    from NewsToDocx import DOCX_TEMPLATE_PATH, STREAMING_THRESHOLD_BYTES, write_blocks_to_word
+
+    size = sum(len(story) for section in document.sections for story in section.stories)
+    write_blocks_to_word(
+        document.blocks(), output_path, logo_path, document.profile,
+        template_path or DOCX_TEMPLATE_PATH, streaming=size >= STREAMING_THRESHOLD_BYTES
+    )
+
+# Output format -> renderer(document, output_path, **options); register_renderer adds more
+RENDERERS = {
+    "markdown": render_markdown,
+    "docx": render_docx,
+    "html": render_html,
+    "text": render_text,
+    "json": render_json
+}
+
+def register_renderer(name, renderer):
+    """Adds or replaces the renderer for an output format."""
+    RENDERERS[name] = renderer
+
+def render_all(document, outputs, max_workers=None, **options):
+    """
+    Renders one document to several formats concurrently; outputs maps format -> output path and
+    options (e.g. logo_path) are passed to every renderer. Raises the first renderer error after all finish.
+    """
+    unknown = set(outputs) - set(RENDERERS)
+    if unknown:
+        raise ValueError(f"❌ No renderer for: {', '.join(sorted(unknown))}")
+
+    def render(name, path):
+        checkpoint()
+        RENDERERS[name](document, path, **options)
+
+    progress = ProgressTracker("render", len(outputs), "formats")
+    with ThreadPoolExecutor(max_workers=max_workers or len(outputs) or 1) as executor:
+        futures = {executor.submit(render, name, path): name for name, path in outputs.items()}
+        for future in as_completed(futures):
+            progress.advance()
+    progress.finish()
+    for future, name in futures.items():
+        future.result()
+        print(f"✅ Rendered {name} digest to {outputs[name]}")
@@ -0,0 +1,70 @@
+import io
+import os
+import re
+import zipfile
+from xml.sax.saxutils import escape
+from NewsCountryProfiles import resolve_profile
+from NewsToDocx import (
+    BODY_STYLE, BOLD_PATTERN, DOCX_TEMPLATE_PATH, HEADING_STYLES, STRONG_STYLE,
+    digest_style_ids, markdown_blocks, render_styled
+)
+
+# Characters that are not allowed in XML 1.0 documents
+INVALID_XML_CHARS = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f]")
+
+def _text_run(text, character_style_id=None):
+    run_properties = f'<w:rPr><w:rStyle w:val="{character_style_id}"/></w:rPr>' if character_style_id else ""
+    return f'<w:r>{run_properties}<w:t xml:space="preserve">{escape(INVALID_XML_CHARS.sub("", text))}</w:t></w:r>'
+
+def paragraph_xml(level, text, style_ids):
+    """
+    Returns the WordprocessingML for one (level, text) block (see NewsToDocx.markdown_blocks).
+    Headings and body paragraphs reference the same named styles as the styled python-docx renderer.
+    """
+    if level:
+        style_name = HEADING_STYLES[level]
+        runs = _text_run(text)
+    else:
+        style_name = BODY_STYLE
+        runs = "".join(
+            _text_run(part, style_ids[STRONG_STYLE] if i % 2 == 1 else None)
+            for i, part in enumerate(re.split(BOLD_PATTERN, text)) if part
+        )
+    return f'<w:p><w:pPr><w:pStyle w:val="{style_ids[style_name]}"/></w:pPr>{runs}</w:p>'
+
+def stream_markdown_to_word(input_md, output_docx, logo_path, profile=None, template_path=DOCX_TEMPLATE_PATH):
+    """
+    Writes the digest .docx by streaming word/document.xml straight into the zip while reading the
+    Markdown digest line by line, so memory stays flat however long the digest is.
+    """
+    with open(input_md, "r", encoding="utf-8") as file:
+        stream_blocks_to_word(markdown_blocks(file), output_docx, logo_path, profile, template_path)
+    print(f"✅ Streamed {input_md} to {output_docx}")
+
+def stream_blocks_to_word(blocks, output_docx, logo_path, profile=None, template_path=DOCX_TEMPLATE_PATH):
+    """
+    Streams (level, text) blocks into word/document.xml inside the .docx zip, one paragraph at a time.
+    The front page (logo, title, TOC field) and the styles come from a small skeleton document
+    rendered by python-docx; every other package part is copied from it unchanged.
+    """
+    profile = resolve_profile(profile)
+    skeleton = render_styled([], logo_path, profile, template_path)
+    style_ids = digest_style_ids(skeleton)
+    skeleton_buffer = io.BytesIO()
+    skeleton.save(skeleton_buffer)
+
+    temp_path = f"{output_docx}.tmp"
+    with zipfile.ZipFile(skeleton_buffer) as source, zipfile.ZipFile(temp_path, "w", zipfile.ZIP_DEFLATED) as target:
+        for item in source.infolist():
+            if item.filename != "word/document.xml":
+                target.writestr(item, source.read(item.filename))
+
+        # The body's final sectPr (page size and margins) has to stay the last element of the body
+        document_xml = source.read("word/document.xml").decode("utf-8")
+        split_at = document_xml.rindex("<w:sectPr")
+        with target.open("word/document.xml", "w", force_zip64=True) as document:
+            document.write(document_xml[:split_at].encode("utf-8"))
+            for level, text in blocks:
+                document.write(paragraph_xml(level, text, style_ids).encode("utf-8"))
+            document.write(document_xml[split_at:].encode("utf-8"))
+    os.replace(temp_path, output_docx)
@@ -0,0 +1,75 @@
+import numpy as np
+from scipy.sparse import csr_matrix, diags
+from NewsNBScorer import word_ngrams
+
+class DigestFeatures:
+    """
+    Per-run feature cache for a digest: the preprocessed summaries are tokenised and their word
+    n-grams counted once into a sparse matrix, from which both the classifier input and the
+    TF-IDF similarity matrix are derived.
+    """
+
+    def __init__(self, processed_texts, ngram_range=(1, 2)):
+        texts = [str(text) for text in processed_texts]
+        self.ngram_range = tuple(ngram_range)
+        self.vocabulary = {}
+        rows, cols = [], []
+        for row, text in enumerate(texts):
+            for gram in word_ngrams(text, self.ngram_range):
+                cols.append(self.vocabulary.setdefault(gram, len(self.vocabulary)))
+            rows.extend([row] * (len(cols) - len(rows)))
+        # Repeated (row, n-gram) pairs are summed into counts
+        self.counts = csr_matrix(
+            (np.ones(len(cols)), (rows, cols)), shape=(len(texts), len(self.vocabulary))
+        )
+        self._tfidf = None
+
+    def counts_for(self, vocabulary, n_features):
+        """
+        Re-indexes the counts onto another vocabulary (term -> column), e.g. the classifier's.
+        N-grams outside that vocabulary are dropped, as CountVectorizer.transform does.
+        """
+        mapping = np.full(len(self.vocabulary), -1, dtype=np.intp)
+        for term, index in self.vocabulary.items():
+            mapping[index] = vocabulary.get(term, -1)
+        coo = self.counts.tocoo()
+        target = mapping[coo.col]
+        keep = target >= 0
+        return csr_matrix(
+            (coo.data[keep], (coo.row[keep], target[keep])), shape=(self.counts.shape[0], n_features)
+        )
+
+    def tfidf(self):
+        """
+        TF-IDF matrix with smoothed idf and l2-normalised rows (TfidfVectorizer's defaults), computed once.
+        """
+        if self._tfidf is None:
+            n_docs = self.counts.shape[0]
+            document_frequency = np.bincount(self.counts.indices, minlength=self.counts.shape[1])
+            idf = np.log((1 + n_docs) / (1 + document_frequency)) + 1
+            weighted = self.counts @ diags(idf)
+            norms = np.sqrt(np.asarray(weighted.multiply(weighted).sum(axis=1)).ravel())
+            self._tfidf = csr_matrix(diags(np.divide(1.0, norms, out=np.zeros_like(norms), where=norms > 0)) @ weighted)
+        return self._tfidf
+
+    def similarity(self):
+        """
+        Dense N×N cosine similarity of the summaries (rows of the TF-IDF matrix are unit length).
+        """
+        tfidf = self.tfidf()
+        return (tfidf @ tfidf.T).toarray()
+
+    def category_mean_similarity(self, assigned, category_names):
+        """
+        N×C matrix of each summary's mean cosine similarity to the summaries assigned to each category,
+        computed as T @ (Tᵀ @ one-hot) from the sparse TF-IDF matrix T so the N×N similarity matrix is
+        never built. Empty categories score 0.
+        """
+        tfidf = self.tfidf()
+        category_index = {name: i for i, name in enumerate(category_names)}
+        codes = np.array([category_index.get(category, -1) for category in assigned], dtype=np.intp)
+        rows = np.flatnonzero(codes >= 0)
+        one_hot = csr_matrix((np.ones(len(rows)), (rows, codes[rows])), shape=(len(codes), len(category_names)))
+        counts = np.asarray(one_hot.sum(axis=0)).ravel()
+        sums = (tfidf @ (tfidf.T @ one_hot)).toarray()
+        return np.divide(sums, counts, out=np.zeros_like(sums), where=counts > 0)
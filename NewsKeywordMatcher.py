@@ -0,0 +1,95 @@
+from collections import deque
+import numpy as np
+
+# A keyword winner is "clear-cut" with at least this many hits and this lead over the runner-up
+KEYWORD_MIN_HITS = 2
+KEYWORD_MIN_LEAD = 2
+
+class KeywordMatcher:
+    """
+    Aho-Corasick automaton over the keyword lists of a categories dict.
+    Scores a text against every category in a single pass, counting whole-word,
+    case-insensitive keyword matches.
+    """
+
+    def __init__(self, keyword_map):
+        self.category_names = list(keyword_map.keys())
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [[]]   # (keyword length, category index) pairs ending at each state
+
+        for category_index, keywords in enumerate(keyword_map.values()):
+            for keyword in keywords:
+                self._add(keyword.lower(), category_index)
+        self._build_failure_links()
+
+    def _add(self, keyword, category_index):
+        state = 0
+        for char in keyword:
+            if char not in self._goto[state]:
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+                self._goto[state][char] = len(self._goto) - 1
+            state = self._goto[state][char]
+        self._output[state].append((len(keyword), category_index))
+
+    def _build_failure_links(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(char, 0)
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+
+    def scores(self, text):
+        """
+        Returns an array with the number of keyword matches per category.
+        """
+        text = str(text).lower()
+        counts = np.zeros(len(self.category_names), dtype=np.int32)
+        state = 0
+        for position, char in enumerate(text):
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+            for length, category_index in self._output[state]:
+                start, end = position - length + 1, position + 1
+                # Whole words only: "war" must not match inside "award"
+                if (start == 0 or not text[start - 1].isalnum()) and (end == len(text) or not text[end].isalnum()):
+                    counts[category_index] += 1
+        return counts
+
+    def score_matrix(self, texts):
+        """
+        Returns an N×C matrix of keyword match counts for many texts.
+        """
+        return np.array([self.scores(text) for text in texts], dtype=np.int32).reshape(-1, len(self.category_names))
+
+    def clear_winners(self, texts):
+        """
+        Returns, per text, the category whose keywords clearly dominate, or None when no category does.
+        """
+        matrix = self.score_matrix(texts)
+        if matrix.shape[1] < 2:
+            ordered = np.hstack([np.zeros_like(matrix), matrix])
+        else:
+            ordered = np.sort(matrix, axis=1)
+        best = matrix.argmax(axis=1)
+        clear = (ordered[:, -1] >= KEYWORD_MIN_HITS) & (ordered[:, -1] - ordered[:, -2] >= KEYWORD_MIN_LEAD)
+        return [self.category_names[b] if is_clear else None for b, is_clear in zip(best, clear)]
+
+_matchers = {}
+
+def get_keyword_matcher(keyword_map):
+    """
+    Returns the automaton for a categories dict, building it only once per distinct keyword set.
+    """
+    key = tuple((category, tuple(keywords)) for category, keywords in keyword_map.items())
+    if key not in _matchers:
+        _matchers[key] = KeywordMatcher(keyword_map)
+    return _matchers[key]
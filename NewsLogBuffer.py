@@ -0,0 +1,68 @@
+import os
+import threading
+import time
+
+# Full logs of GUI runs: one file per run, and one per country when running all countries
+LOG_DIR = os.getenv("NEWS_LOG_DIR", "logs")
+# Lines kept in each terminal pane; older lines are only in the log file
+MAX_TERMINAL_LINES = int(os.getenv("NEWS_LOG_MAX_LINES", "2000"))
+
+def run_log_path(name=None, log_dir=LOG_DIR):
+    """
+    Log file for a run starting now, e.g. logs/news_processor_20250601_093000_finland.log.
+    """
+    suffix = f"_{name.lower()}" if name else ""
+    return os.path.join(log_dir, f"news_processor_{time.strftime('%Y%m%d_%H%M%S')}{suffix}.log")
+
+class LogBuffer:
+    """
+    Stands in for sys.stdout and sys.stderr of a background run. Every write goes to the log file and
+    into a buffer that the Tk thread empties once per tick with drain(), so a terminal pane gets one
+    insert per tick however many small writes the run makes.
+    """
+
+    def __init__(self, log_path=None, max_lines=MAX_TERMINAL_LINES):
+        self.log_path = log_path
+        self.max_lines = max_lines
+        self._pending = []
+        self._lock = threading.Lock()
+        self._file = None
+        if log_path:
+            os.makedirs(os.path.dirname(log_path) or ".", exist_ok=True)
+            self._file = open(log_path, "a", encoding="utf-8")
+
+    def write(self, s):
+        if not s:
+            return
+        with self._lock:
+            self._pending.append(s)
+            if self._file:
+                self._file.write(s)
+
+    def flush(self):
+        with self._lock:
+            if self._file:
+                self._file.flush()
+
+    def drain(self):
+        """
+        Returns everything written since the last drain. When that is more than a pane holds,
+        only the latest max_lines lines are returned.
+        """
+        with self._lock:
+            text = "".join(self._pending)
+            self._pending = []
+            if self._file:
+                self._file.flush()
+        lines = text.split("\n")
+        if len(lines) > self.max_lines + 1:
+            omitted = len(lines) - self.max_lines - 1
+            where = f"; see {self.log_path}" if self.log_path else ""
+            text = f"… {omitted} lines not shown{where}\n" + "\n".join(lines[-self.max_lines - 1:])
+        return text
+
+    def close(self):
+        with self._lock:
+            if self._file:
+                self._file.close()
+                self._file = None
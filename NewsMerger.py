@@ -1,4 +1,6 @@
 import pandas as pd
+from NewsCancellation import checkpoint
+from NewsProgress import ProgressTracker
 
 def extract_numeric_day(date_string):
     """
@@ -19,7 +21,10 @@ def merge_story_groups(input_csv, output_csv="merged_stories.csv", output_excel=
     df = pd.read_csv(input_csv)
 
     merged_stories = []
-    for group_id, group in df.groupby("Story Group ID"):
+    groups = df.groupby("Story Group ID")
+    progress = ProgressTracker("merge", groups.ngroups, "story groups")
+    for group_id, group in groups:
+        checkpoint()
         # Extract unique dates & sort numerically
         date_objects = sorted(set(group["Date"]), key=extract_numeric_day)
         
@@ -32,6 +37,8 @@ def merge_story_groups(input_csv, output_csv="merged_stories.csv", output_excel=
 
         # Store the merged data
         merged_stories.append([group_id, sorted_dates, headlines, full_story])
+        progress.advance()
+    progress.finish()
 
     # Convert to DataFrame
     merged_df = pd.DataFrame(merged_stories, columns=["Story Group ID", "Dates", "Headlines", "Merged Content"])
@@ -0,0 +1,121 @@
+import hashlib
+import json
+import os
+import pickle
+import threading
+import time
+from importlib import metadata
+
+MODEL_CACHE_DIR = os.getenv("NEWS_MODEL_CACHE", "model_cache")
+
+# Fingerprints currently being retrained in the background
+_retraining = set()
+_retraining_lock = threading.Lock()
+
+def _library_version(package):
+    try:
+        return metadata.version(package)
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+def fingerprint_training(training_files, params):
+    """
+    Fingerprints the training data contents, the model hyperparameters and the scikit-learn version.
+    """
+    digest = hashlib.sha256()
+    for path in sorted(training_files, key=os.path.basename):
+        digest.update(os.path.basename(path).encode("utf-8"))
+        with open(path, "rb") as file:
+            for chunk in iter(lambda: file.read(1 << 20), b""):
+                digest.update(chunk)
+    digest.update(json.dumps(params, sort_keys=True).encode("utf-8"))
+    digest.update(_library_version("scikit-learn").encode("utf-8"))
+    return digest.hexdigest()
+
+def _cache_paths(cache_dir, name):
+    return os.path.join(cache_dir, f"{name}.pkl"), os.path.join(cache_dir, f"{name}.json")
+
+def load_cached_model(name, cache_dir=MODEL_CACHE_DIR):
+    """
+    Loads a cached model and its metadata. Returns (None, None) if there is none or it is unreadable.
+    """
+    model_path, meta_path = _cache_paths(cache_dir, name)
+    try:
+        with open(meta_path, "r", encoding="utf-8") as file:
+            meta = json.load(file)
+        with open(model_path, "rb") as file:
+            return pickle.load(file), meta
+    except (OSError, ValueError, pickle.UnpicklingError, AttributeError, ImportError, EOFError):
+        return None, None
+
+def _atomic_write(path, data):
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "wb") as file:
+        file.write(data)
+    os.replace(temp_path, path)
+
+def save_cached_model(model, fingerprint, name, cache_dir=MODEL_CACHE_DIR, training_files=()):
+    """
+    Saves a model and its fingerprint atomically; the metadata is written last so a
+    partially written model is never picked up.
+    """
+    os.makedirs(cache_dir, exist_ok=True)
+    model_path, meta_path = _cache_paths(cache_dir, name)
+    meta = {
+        "fingerprint": fingerprint,
+        "trained_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "training_files": [os.path.basename(path) for path in training_files]
+    }
+    _atomic_write(model_path, pickle.dumps(model, protocol=pickle.HIGHEST_PROTOCOL))
+    _atomic_write(meta_path, json.dumps(meta, indent=2).encode("utf-8"))
+
+def _retrain_in_background(train, training_files, fingerprint, name, cache_dir, on_save=None):
+    with _retraining_lock:
+        if fingerprint in _retraining:
+            return
+        _retraining.add(fingerprint)
+
+    def run():
+        try:
+            model = train(training_files)
+            save_cached_model(model, fingerprint, name, cache_dir, training_files)
+            if on_save:
+                on_save(model, fingerprint)
+            print(f"✅ Background retraining finished; cached {name} updated")
+        except Exception as e:
+            print(f"⚠️ Background retraining of {name} failed: {e}")
+        finally:
+            with _retraining_lock:
+                _retraining.discard(fingerprint)
+
+    threading.Thread(target=run, name=f"retrain-{name}").start()
+
+def get_model(train, training_files, params, name, cache_dir=MODEL_CACHE_DIR, background=True, on_save=None):
+    """
+    Returns (model, current), training only when needed:
+    - fingerprint matches the cache: load the pickled model;
+    - fingerprint changed but an older model exists: use it now and retrain in the background
+      (or retrain immediately when background is False);
+    - no cached model: train now and cache the result.
+    current is False only for the older model handed out while the retrain is pending.
+    on_save(model, fingerprint) is called whenever a newly trained model is cached, e.g. to export it.
+    """
+    start = time.perf_counter()
+    fingerprint = fingerprint_training(training_files, params)
+    model, meta = load_cached_model(name, cache_dir)
+
+    if model is not None and meta.get("fingerprint") == fingerprint:
+        print(f"⚡ Loaded cached {name} in {(time.perf_counter() - start) * 1000:.0f} ms")
+        return model, True
+
+    if model is not None and background:
+        print(f"🔄 Training data changed; using the previous {name} while retraining in the background")
+        _retrain_in_background(train, training_files, fingerprint, name, cache_dir, on_save)
+        return model, False
+
+    print(f"🧠 Training {name}...")
+    model = train(training_files)
+    save_cached_model(model, fingerprint, name, cache_dir, training_files)
+    if on_save:
+        on_save(model, fingerprint)
+    return model, True
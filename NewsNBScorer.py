@@ -0,0 +1,167 @@
+import os
+import re
+import numpy as np
+
+# CountVectorizer's default token pattern
+TOKEN_PATTERN = r"(?u)\b\w\w+\b"
+
+def word_ngrams(text, ngram_range=(1, 2), token_regex=re.compile(TOKEN_PATTERN), lowercase=True):
+    """
+    Tokenises text and returns its word n-grams exactly as CountVectorizer's word analyser does.
+    """
+    tokens = token_regex.findall(text.lower() if lowercase else text)
+    min_n, max_n = ngram_range
+    ngrams = list(tokens) if min_n == 1 else []
+    for n in range(max(min_n, 2), min(max_n, len(tokens)) + 1):
+        ngrams.extend(" ".join(tokens[i:i + n]) for i in range(len(tokens) - n + 1))
+    return ngrams
+
+class NaiveBayesScorer:
+    """
+    NumPy-only stand-in for a fitted CountVectorizer + MultinomialNB pipeline.
+    Holds the vocabulary and the Naïve Bayes counts/log-probabilities, and reproduces
+    predict_proba without importing scikit-learn.
+    """
+
+    def __init__(self, terms, classes, feature_count, class_count, alpha=1.0,
+                 ngram_range=(1, 2), token_pattern=TOKEN_PATTERN, lowercase=True, fingerprint=None):
+        self.terms = np.asarray(terms, dtype=str)
+        self.vocabulary = {term: index for index, term in enumerate(self.terms)}
+        self.classes_ = np.asarray(classes, dtype=object)
+        self.feature_count = np.asarray(feature_count, dtype=np.float64)
+        self.class_count = np.asarray(class_count, dtype=np.float64)
+        self.alpha = float(alpha)
+        self.ngram_range = tuple(int(n) for n in ngram_range)
+        self.token_pattern = token_pattern
+        self.lowercase = bool(lowercase)
+        self.fingerprint = fingerprint
+        self._token_regex = re.compile(token_pattern)
+        self._update_log_probabilities()
+
+    @classmethod
+    def from_pipeline(cls, classifier, fingerprint=None):
+        """
+        Exports a fitted make_pipeline(CountVectorizer, MultinomialNB) into a scorer.
+        """
+        vectorizer, model = classifier.steps[0][1], classifier.steps[-1][1]
+        terms = np.empty(len(vectorizer.vocabulary_), dtype=object)
+        for term, index in vectorizer.vocabulary_.items():
+            terms[index] = term
+        return cls(
+            terms=terms.astype(str),
+            classes=model.classes_,
+            feature_count=model.feature_count_,
+            class_count=model.class_count_,
+            alpha=model.alpha,
+            ngram_range=vectorizer.ngram_range,
+            token_pattern=vectorizer.token_pattern,
+            lowercase=vectorizer.lowercase,
+            fingerprint=fingerprint
+        )
+
+    def _update_log_probabilities(self):
+        # Same smoothing and priors as MultinomialNB(fit_prior=True)
+        smoothed = self.feature_count + self.alpha
+        self.feature_log_prob = np.log(smoothed) - np.log(smoothed.sum(axis=1, keepdims=True))
+        self.class_log_prior = np.log(self.class_count) - np.log(self.class_count.sum())
+
+    def _ngrams(self, text):
+        return word_ngrams(text, self.ngram_range, self._token_regex, self.lowercase)
+
+    def _feature_indices(self, texts):
+        """
+        Returns (document ids, feature ids) for every in-vocabulary n-gram occurrence.
+        """
+        doc_ids, feature_ids = [], []
+        for doc_id, text in enumerate(texts):
+            indices = [self.vocabulary[g] for g in self._ngrams(str(text)) if g in self.vocabulary]
+            feature_ids.extend(indices)
+            doc_ids.extend([doc_id] * len(indices))
+        return np.asarray(doc_ids, dtype=np.intp), np.asarray(feature_ids, dtype=np.intp)
+
+    def joint_log_likelihood(self, texts):
+        texts = list(texts)
+        doc_ids, feature_ids = self._feature_indices(texts)
+        jll = np.zeros((len(texts), len(self.classes_)))
+        np.add.at(jll, doc_ids, self.feature_log_prob.T[feature_ids])
+        return jll + self.class_log_prior
+
+    def predict_proba(self, texts):
+        """
+        Class probabilities for preprocessed texts, matching MultinomialNB.predict_proba.
+        """
+        return self._normalise(self.joint_log_likelihood(texts))
+
+    def predict_proba_counts(self, counts):
+        """
+        Class probabilities from an n-gram count matrix whose columns follow self.terms.
+        """
+        return self._normalise(np.asarray(counts @ self.feature_log_prob.T) + self.class_log_prior)
+
+    @staticmethod
+    def _normalise(jll):
+        top = jll.max(axis=1, keepdims=True)
+        log_prob_x = top + np.log(np.exp(jll - top).sum(axis=1, keepdims=True))
+        return np.exp(jll - log_prob_x)
+
+    def predict(self, texts):
+        return self.classes_[self.joint_log_likelihood(texts).argmax(axis=1)]
+
+    def partial_fit(self, texts, labels):
+        """
+        Adds labelled texts to the counts, like MultinomialNB.partial_fit on a fixed vocabulary.
+        Labels outside classes_ are ignored. Returns True if every label was known.
+        """
+        class_index = {label: i for i, label in enumerate(self.classes_)}
+        texts, labels = list(texts), list(labels)
+        known = [label in class_index for label in labels]
+        doc_ids, feature_ids = self._feature_indices(texts)
+        for doc_id, label in enumerate(labels):
+            if known[doc_id]:
+                self.class_count[class_index[label]] += 1
+        keep = np.asarray([known[d] for d in doc_ids], dtype=bool)
+        rows = np.asarray([class_index[labels[d]] for d in doc_ids[keep]], dtype=np.intp)
+        np.add.at(self.feature_count, (rows, feature_ids[keep]), 1)
+        self._update_log_probabilities()
+        return all(known)
+
+    def save(self, path):
+        """
+        Saves the scorer as a compressed .npz artifact (written atomically).
+        """
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        temp_path = f"{path}.tmp.npz"
+        np.savez_compressed(
+            temp_path,
+            terms=self.terms,
+            classes=self.classes_.astype(str),
+            feature_count=self.feature_count,
+            class_count=self.class_count,
+            alpha=self.alpha,
+            ngram_range=np.asarray(self.ngram_range),
+            token_pattern=self.token_pattern,
+            lowercase=self.lowercase,
+            fingerprint=self.fingerprint or ""
+        )
+        os.replace(temp_path, path)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Loads a scorer saved with save(); returns None if the file is missing or unreadable.
+        """
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                return cls(
+                    terms=data["terms"],
+                    classes=data["classes"],
+                    feature_count=data["feature_count"],
+                    class_count=data["class_count"],
+                    alpha=float(data["alpha"]),
+                    ngram_range=tuple(data["ngram_range"]),
+                    token_pattern=str(data["token_pattern"]),
+                    lowercase=bool(data["lowercase"]),
+                    fingerprint=str(data["fingerprint"]) or None
+                )
+        except (OSError, KeyError, ValueError):
+            return None
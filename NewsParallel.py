@@ -0,0 +1,118 @@
+import multiprocessing
+import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor
+import NewsTelemetry
+from NewsCancellation import PipelineCancelled, set_cancellation_token, shared_cancellation_token
+from NewsProgress import set_progress_sink
+from NewsPipeline import run_country
+from NewsRateLimiter import REQUESTS_PER_MINUTE, TOKENS_PER_MINUTE, shared_rate_limiter
+
+# Text buffered by a country process before it is sent without waiting for the end of the line
+OUTPUT_BATCH_CHARS = 8192
+
+# Spawned (not forked) workers behave the same on macOS, Windows and Linux and never inherit Tk's threads
+PROCESS_CONTEXT = multiprocessing.get_context("spawn")
+
+class _EventWriter:
+    """
+    Stands in for sys.stdout and sys.stderr in a country's process: everything printed
+    becomes a (country, "output", text) event for the parent. Writes are buffered and sent as
+    complete lines, so a print() costs one message rather than one per fragment.
+    """
+    def __init__(self, events, country):
+        self.events = events
+        self.country = country
+        self._pending = ""
+        self._lock = threading.Lock()
+
+    def write(self, s):
+        if not s:
+            return
+        with self._lock:
+            self._pending += s
+            end = self._pending.rfind("\n") + 1
+            if not end and len(self._pending) >= OUTPUT_BATCH_CHARS:
+                end = len(self._pending)
+            text, self._pending = self._pending[:end], self._pending[end:]
+        if text:
+            self.events.put((self.country, "output", text))
+
+    def flush(self):
+        with self._lock:
+            text, self._pending = self._pending, ""
+        if text:
+            self.events.put((self.country, "output", text))
+
+def _init_worker(rate_limiter, token):
+    NewsTelemetry.set_rate_limiter(rate_limiter)
+    set_cancellation_token(token)
+
+def _run_country_worker(country, input_files, training_data_path, events, options):
+    writer = _EventWriter(events, country)
+    sys.stdout = sys.stderr = writer
+    set_progress_sink(lambda event: events.put((country, "progress", event.as_dict())))
+
+    def on_stage(name, status):
+        events.put((country, "stage", (name, status)))
+
+    try:
+        return run_country(country, input_files, training_data_path, on_stage=on_stage, **options)
+    finally:
+        # Send the last line even if it has no newline
+        writer.flush()
+
+def run_countries(country_files, training_data_path, on_event, max_workers=None,
+                  requests_per_minute=REQUESTS_PER_MINUTE, tokens_per_minute=TOKENS_PER_MINUTE, token=None, **options):
+    """
+    Runs the digest pipeline for several countries at once, one process per country; country_files maps
+    each country to its input files. All processes share one LLM rate limiter, so together they stay
+    within the account quota. Cancelling or pausing token (a CancellationToken) cancels or pauses every
+    country's process. Other keyword options (force, store_dir, only, logo_path, output_dir)
+    are passed on to run_country.
+    on_event(country, kind, value) is called from a background thread of this process with:
+    - "output": text the country's run printed;
+    - "stage": (stage name, status) as reported by run_pipeline;
+    - "progress": a ProgressEvent of the running stage, as a dict;
+    - "done": the country's {stage name: status}, "cancelled" or "failed": its error message.
+    Returns {country: {stage name: status} or the exception that stopped it}.
+    """
+    results = {}
+    with PROCESS_CONTEXT.Manager() as manager:
+        events = manager.Queue()
+        rate_limiter = shared_rate_limiter(manager, requests_per_minute, tokens_per_minute)
+        shared_token = shared_cancellation_token(manager)
+        if token is not None:
+            token.link(shared_token)
+
+        def pump():
+            while True:
+                event = events.get()
+                if event is None:
+                    return
+                on_event(*event)
+
+        pump_thread = threading.Thread(target=pump, name="country-events")
+        pump_thread.start()
+
+        def finished(country, future):
+            error = future.exception()
+            results[country] = error if error else future.result()
+            if isinstance(error, PipelineCancelled):
+                events.put((country, "cancelled", str(error)))
+            else:
+                events.put((country, "failed", str(error)) if error else (country, "done", results[country]))
+
+        try:
+            with ProcessPoolExecutor(max_workers=max_workers or len(country_files), mp_context=PROCESS_CONTEXT,
+                                     initializer=_init_worker, initargs=(rate_limiter, shared_token)) as executor:
+                for country, input_files in country_files.items():
+                    future = executor.submit(_run_country_worker, country, input_files, training_data_path,
+                                             events, options)
+                    future.add_done_callback(lambda future, country=country: finished(country, future))
+        finally:
+            if token is not None:
+                token.unlink(shared_token)
+            events.put(None)
+            pump_thread.join()
+    return results
@@ -0,0 +1,337 @@
+import hashlib
+import importlib.util
+import json
+import os
+import time
+from dataclasses import dataclass, field
+import NewsTelemetry
+from NewsCancellation import checkpoint
+from NewsArtifactStore import ARTIFACT_STORE_DIR, ArtifactStore
+from NewsCountryProfiles import load_profile
+
+# Bump to invalidate every cached stage, e.g. after changing how fingerprints are computed
+PIPELINE_VERSION = "1"
+
+# Stage statuses reported to on_stage callbacks; RESTORED outputs came from the artifact store and
+# SKIPPED stages were left out of the run (their earlier outputs are used as they are)
+RUNNING, RAN, CACHED, RESTORED, SKIPPED = "running", "ran", "cached", "restored", "skipped"
+
+# Label stores of LLM-confirmed categories and their escalation metrics; user-writable like the caches
+LABEL_STORE_DIR = os.getenv("NEWS_LABEL_STORE", "label_store")
+
+# Stages declared by digest_pipeline, in pipeline order
+DIGEST_STAGES = ("extract", "chain", "merge", "summarise", "digest", "render")
+
+@dataclass
+class Stage:
+    """
+    One pipeline step. run(context) must write every path in outputs; context is a dict shared by the
+    stages of one run (e.g. for in-memory results). Stages are ordered by their file dependencies and
+    a stage is skipped when the fingerprint of its input files, params, code modules and version
+    matches its last successful run and its outputs are still as that run left them.
+    """
+    name: str
+    run: object
+    inputs: list = field(default_factory=list)
+    outputs: list = field(default_factory=list)
+    params: dict = field(default_factory=dict)
+    code: list = field(default_factory=list)
+    version: str = "1"
+
+def file_digest(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def code_version(modules):
+    """
+    Hashes the source of the given modules, so editing a stage's code invalidates it.
+    Modules without a readable source file (e.g. in a frozen build) are recorded by name only.
+    """
+    digest = hashlib.sha256()
+    for module in sorted(modules):
+        digest.update(module.encode("utf-8"))
+        spec = importlib.util.find_spec(module)
+        origin = spec.origin if spec else None
+        if origin and os.path.isfile(origin):
+            digest.update(file_digest(origin).encode("utf-8"))
+    return digest.hexdigest()
+
+def stage_fingerprint(stage):
+    """
+    Fingerprints a stage from its version, params, code and the names and contents of its input files.
+    Output names are included so changing where a stage writes also re-runs it.
+    """
+    description = {
+        "pipeline": PIPELINE_VERSION,
+        "version": stage.version,
+        "params": stage.params,
+        "code": code_version(stage.code),
+        "inputs": [[os.path.basename(path), file_digest(path)] for path in stage.inputs],
+        "outputs": [os.path.basename(path) for path in stage.outputs]
+    }
+    return hashlib.sha256(json.dumps(description, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+def order_stages(stages):
+    """
+    Orders stages so each runs after the stages producing its inputs; independent stages keep their
+    declared order. Raises ValueError if two stages write the same file or the dependencies form a cycle.
+    """
+    producers = {}
+    for stage in stages:
+        for path in stage.outputs:
+            key = os.path.abspath(path)
+            if key in producers:
+                raise ValueError(f"❌ Stages {producers[key].name} and {stage.name} both write {path}")
+            producers[key] = stage
+
+    dependencies = {
+        stage.name: {producers[os.path.abspath(path)].name for path in stage.inputs if os.path.abspath(path) in producers}
+        for stage in stages
+    }
+    ordered, done = [], set()
+    while len(ordered) < len(stages):
+        ready = [stage for stage in stages if stage.name not in done and dependencies[stage.name] <= done]
+        if not ready:
+            cycle = ", ".join(stage.name for stage in stages if stage.name not in done)
+            raise ValueError(f"❌ Pipeline stages form a cycle: {cycle}")
+        ordered.append(ready[0])
+        done.add(ready[0].name)
+    return ordered
+
+def load_manifest(path):
+    """
+    Loads the record of the last successful run of each stage. Returns {} if there is none or it is unreadable.
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return {}
+
+def save_manifest(path, manifest):
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as file:
+        json.dump(manifest, file, indent=2)
+    os.replace(temp_path, path)
+
+def _outputs_intact(entry):
+    return all(os.path.exists(path) and file_digest(path) == digest for path, digest in entry["outputs"].items())
+
+def _record_run(manifest, stage, fingerprint, seconds):
+    manifest[stage.name] = {
+        "fingerprint": fingerprint,
+        "outputs": {path: file_digest(path) for path in stage.outputs},
+        "completed_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "seconds": round(seconds, 2)
+    }
+
+def run_pipeline(stages, manifest_path, context=None, on_stage=None, force=False, store=None, only=None):
+    """
+    Runs the stages in dependency order, skipping those whose fingerprint matches the manifest.
+    With an ArtifactStore, a stage missing locally is restored from the store when any run that shares
+    it has computed the same fingerprint, and every stage that runs is published to it.
+    When force is True every stage runs. With only (a collection of stage names) the other stages are
+    SKIPPED, which requires their outputs to exist already. The manifest is saved after every stage,
+    so a failure part-way keeps the stages that already finished.
+    on_stage(name, status) is called with RUNNING before a stage runs and RAN, CACHED, RESTORED or
+    SKIPPED afterwards. Returns {stage name: status}.
+    A cancelled run (PipelineCancelled) stops before the next stage or item; the stage it stopped in
+    is not recorded, so the next run does it again.
+    """
+    context = {} if context is None else context
+    manifest = load_manifest(manifest_path)
+    statuses = {}
+
+    for stage in order_stages(stages):
+        checkpoint()
+        if only is not None and stage.name not in only:
+            missing = [path for path in stage.outputs if not os.path.exists(path)]
+            if missing:
+                raise RuntimeError(f"❌ Stage {stage.name} is not selected but its outputs are missing: {', '.join(missing)}")
+            statuses[stage.name] = SKIPPED
+            if on_stage:
+                on_stage(stage.name, SKIPPED)
+            continue
+        fingerprint = stage_fingerprint(stage)
+        entry = manifest.get(stage.name)
+        if not force and entry and entry["fingerprint"] == fingerprint and _outputs_intact(entry):
+            print(f"⚡ {stage.name}: inputs unchanged, reusing outputs from {entry['completed_at']}")
+            if store and not store.contains(fingerprint):
+                # Computed before the store was set up (or evicted from it): share it now
+                store.publish(fingerprint, stage.name, stage.outputs)
+            statuses[stage.name] = CACHED
+        elif not force and store and store.fetch(fingerprint, stage.outputs):
+            print(f"📦 {stage.name}: restored outputs from the artifact store")
+            _record_run(manifest, stage, fingerprint, 0)
+            save_manifest(manifest_path, manifest)
+            statuses[stage.name] = RESTORED
+        else:
+            if on_stage:
+                on_stage(stage.name, RUNNING)
+            start = time.perf_counter()
+            stage.run(context)
+            missing = [path for path in stage.outputs if not os.path.exists(path)]
+            if missing:
+                raise RuntimeError(f"❌ Stage {stage.name} did not write {', '.join(missing)}")
+            _record_run(manifest, stage, fingerprint, time.perf_counter() - start)
+            save_manifest(manifest_path, manifest)
+            if store:
+                store.publish(fingerprint, stage.name, stage.outputs)
+            statuses[stage.name] = RAN
+        if on_stage:
+            on_stage(stage.name, statuses[stage.name])
+
+    if store:
+        store.collect_garbage()
+    return statuses
+
+def digest_pipeline(profile, input_files, training_files, label_store=None, logo_path="Mundus_Icon.png", output_dir="."):
+    """
+    Declares the monthly digest stages for one country: extract, chain, merge, summarise, digest and render.
+    Every output is written to output_dir under the profile's file names.
+    The label store is updated by the digest stage but is not one of its inputs, otherwise every run
+    would invalidate the next one; it only ever gains labels from the same summaries.
+    """
+    from NewsToDocx import DOCX_TEMPLATE_PATH
+
+    files = {key: os.path.join(output_dir, profile.file_name(key)) for key in (
+        "extracted_csv", "extracted_xlsx", "chained_csv", "merged_csv", "merged_xlsx", "summarised_csv",
+        "summarised_xlsx", "digest_md", "digest_json", "digest_docx", "digest_html", "digest_txt"
+    )}
+
+    def extract(context):
+        from NewsToCsv import process_markdown_files, save_to_csv, save_to_excel
+        articles = process_markdown_files(input_files)
+        save_to_csv(articles, files["extracted_csv"])
+        save_to_excel(articles, files["extracted_xlsx"])
+
+    def chain(context):
+        import pandas as pd
+        from NewsChainer import find_related_articles, format_chained_articles, save_chained_articles
+        grouped_articles, article_index_map = find_related_articles(pd.read_csv(files["extracted_csv"]))
+        save_chained_articles(format_chained_articles(grouped_articles, article_index_map), files["chained_csv"])
+
+    def merge(context):
+        from NewsMerger import merge_story_groups
+        merge_story_groups(files["chained_csv"], files["merged_csv"], files["merged_xlsx"])
+
+    def summarise(context):
+        from NewsSummariser import summarise_merged_stories
+        summarise_merged_stories(
+            input_csv=files["merged_csv"],
+            output_csv=files["summarised_csv"],
+            output_excel=files["summarised_xlsx"],
+            profile=profile
+        )
+
+    def digest(context):
+        import pandas as pd
+        from NewsDigestor import generate_monthly_digest
+        from NewsDocumentModel import render_json
+        from NewsTrainingStore import digest_month
+        context["document"] = generate_monthly_digest(
+            files["summarised_xlsx"], files["digest_md"], training_files, label_store=label_store, profile=profile,
+            month=digest_month(pd.read_csv(files["extracted_csv"])["Date"])
+        )
+        render_json(context["document"], files["digest_json"])
+
+    def render(context):
+        from NewsDocumentModel import load_document, render_all
+        # Reuse the digest stage's document when it ran, otherwise load the one it saved
+        document = context.get("document") or load_document(files["digest_json"], profile)
+        render_all(
+            document,
+            {"docx": files["digest_docx"], "html": files["digest_html"], "text": files["digest_txt"]},
+            logo_path=logo_path
+        )
+
+    template_inputs = [DOCX_TEMPLATE_PATH] if os.path.exists(DOCX_TEMPLATE_PATH) else []
+    return [
+        Stage("extract", extract, list(input_files), [files["extracted_csv"], files["extracted_xlsx"]],
+              code=["NewsToCsv"]),
+        Stage("chain", chain, [files["extracted_csv"]], [files["chained_csv"]], code=["NewsChainer"]),
+        Stage("merge", merge, [files["chained_csv"]], [files["merged_csv"], files["merged_xlsx"]],
+              code=["NewsMerger"]),
+        Stage("summarise", summarise, [files["merged_csv"]], [files["summarised_csv"], files["summarised_xlsx"]],
+              params={"prompts": profile.prompts},
+              code=["NewsSummariser", "NewsPrompts", "NewsTelemetry", "NewsScheduler", "NewsSummaryCache",
+                    "NewsCountryProfiles"]),
+        Stage("digest", digest, [files["summarised_xlsx"], files["extracted_csv"]] + sorted(training_files),
+              [files["digest_md"], files["digest_json"]],
+              params={
+                  "categories": profile.categories,
+                  "llm_categories": profile.llm_categories,
+                  "category_order": profile.category_order,
+                  "prompts": profile.prompts
+              },
+              code=["NewsDigestor", "NewsPrompts", "NewsTelemetry", "NewsFeatures", "NewsNBScorer",
+                    "NewsKeywordMatcher", "NewsModelCache", "NewsTrainingStore", "NewsDocumentModel",
+                    "NewsCountryProfiles"]),
+        Stage("render", render, [files["digest_json"], logo_path] + template_inputs,
+              [files["digest_docx"], files["digest_html"], files["digest_txt"]],
+              params={"docx_title": profile.docx_title},
+              code=["NewsDocumentModel", "NewsToDocx", "NewsDocxStream"])
+    ]
+
+def find_training_files(training_data_path):
+    """
+    Lists the TrainingData*.xlsx files (shared by all countries) in the training data directory.
+    """
+    training_files = [
+        os.path.join(training_data_path, file) for file in sorted(os.listdir(training_data_path))
+        if file.startswith("TrainingData") and file.endswith(".xlsx")
+    ]
+    if not training_files:
+        raise FileNotFoundError("No training data files found!")
+    return training_files
+
+def open_artifact_store(store_dir=ARTIFACT_STORE_DIR):
+    """
+    Opens the artifact store, or returns None when it is disabled (empty store_dir) or unreachable.
+    """
+    if not store_dir:
+        return None
+    try:
+        return ArtifactStore(store_dir)
+    except OSError as e:
+        print(f"⚠️ Artifact store {store_dir} is unavailable, running without it: {e}")
+        return None
+
+def run_country(country, input_files, training_data_path, on_stage=None, force=False, store_dir=ARTIFACT_STORE_DIR,
+                only=None, logo_path="Mundus_Icon.png", output_dir="."):
+    """
+    Runs the monthly digest pipeline for one country and writes its LLM run report; the pipeline outputs,
+    manifest and report go to output_dir. The label store is kept in LABEL_STORE_DIR, outside the
+    (possibly read-only) training data directory.
+    Returns {stage name: status} as run_pipeline does.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    profile = load_profile(country)
+    stages = digest_pipeline(
+        profile,
+        input_files,
+        find_training_files(training_data_path),
+        label_store=os.path.join(LABEL_STORE_DIR, profile.file_name("label_store")),
+        logo_path=logo_path,
+        output_dir=output_dir
+    )
+    llm_report_json = os.path.join(output_dir, profile.file_name("llm_report"))
+
+    NewsTelemetry.reset_run()
+    try:
+        return run_pipeline(
+            stages,
+            os.path.join(output_dir, profile.file_name("pipeline_manifest")),
+            on_stage=on_stage,
+            force=force,
+            store=open_artifact_store(store_dir),
+            only=only
+        )
+    finally:
+        # Report LLM latency, tokens and cost even if a stage failed part-way
+        report = NewsTelemetry.write_run_report(llm_report_json)
+        print(NewsTelemetry.format_run_summary(report))
+        print(f"📄 LLM run report saved to {llm_report_json}")
@@ -0,0 +1,187 @@
+"""
+Headless entry point for scheduled server-side runs of the monthly digest pipeline (same engine as the GUI).
+
+Progress is written to stdout as JSON lines, one event per line (start, stage, progress with items done,
+throughput and ETA, done, failed, finished); everything the pipeline prints goes to stderr.
+Exit codes: 0 success, 1 a country's pipeline failed, 2 invalid arguments, 3 no input files matched,
+130 interrupted.
+
+Examples:
+    python NewsProcessorCLI.py --country Finland "news/finland/*.md" --output-dir out/2025-05
+    python NewsProcessorCLI.py --country Sweden --country Poland "news/{tag}/*.md" --jobs 2
+    python NewsProcessorCLI.py --country Finland "news/finland/*.md" --stages render --force
+"""
+
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+import traceback
+from NewsCountryProfiles import DEFAULT_COUNTRY, available_countries, load_profile
+
+EXIT_OK = 0
+EXIT_FAILED = 1
+EXIT_USAGE = 2
+EXIT_NO_INPUT = 3
+EXIT_INTERRUPTED = 130
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        description="Generate monthly news digests without the GUI.",
+        epilog=__doc__.split("\n\n", 1)[1],
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("inputs", nargs="+", help="Markdown news files or glob patterns; {name} and {tag} "
+                        "are replaced with each country's name and file tag")
+    parser.add_argument("--country", action="append", choices=available_countries(),
+                        help=f"Country to process; repeat for several countries (default: {DEFAULT_COUNTRY})")
+    parser.add_argument("--output-dir", default=".", help="Directory for all outputs (default: current directory)")
+    parser.add_argument("--training-data", default=os.path.join(ROOT, "TrainingData"),
+                        help="Directory with the TrainingData*.xlsx files")
+    parser.add_argument("--logo", default=os.path.join(ROOT, "Mundus_Icon.png"), help="Logo for the Word digest")
+    parser.add_argument("--jobs", type=int, default=None,
+                        help="Countries processed in parallel (default: all of them)")
+    parser.add_argument("--summary-workers", type=int, default=None,
+                        help="Story groups summarised concurrently per country")
+    parser.add_argument("--stages", default=None,
+                        help="Comma-separated stages to run (extract, chain, merge, summarise, digest, render); "
+                             "the others reuse their existing outputs")
+    parser.add_argument("--force", action="store_true", help="Run the selected stages even if their inputs are unchanged")
+    parser.add_argument("--model-cache", default=None, help="Classifier cache directory")
+    parser.add_argument("--summary-cache", default=None, help="Summary cache JSON file")
+    parser.add_argument("--label-store", default=None, help="Directory of the LLM-confirmed label stores")
+    parser.add_argument("--artifact-store", default=None,
+                        help="Artifact store directory, e.g. a shared folder (empty string disables it)")
+    return parser
+
+def configure_environment(args):
+    """
+    Sets the environment variables the engine modules read their settings from at import time,
+    so they also reach the worker processes of a multi-country run.
+    """
+    locations = {
+        "NEWS_MODEL_CACHE": args.model_cache,
+        "NEWS_SUMMARY_CACHE": args.summary_cache,
+        "NEWS_LABEL_STORE": args.label_store,
+        "NEWS_ARTIFACT_STORE": args.artifact_store
+    }
+    for variable, path in locations.items():
+        if path is not None:
+            os.environ[variable] = path
+    if args.summary_workers:
+        os.environ["NEWS_SUMMARY_WORKERS"] = str(args.summary_workers)
+
+def expand_inputs(patterns, profile):
+    """
+    Expands the input patterns for one country into file paths, in order and without duplicates.
+    Only {name} and {tag} are replaced; other braces in a pattern are kept as they are.
+    """
+    files = []
+    for pattern in patterns:
+        pattern = pattern.replace("{name}", profile.name).replace("{tag}", profile.file_tag)
+        for path in sorted(glob.glob(pattern)):
+            if path not in files:
+                files.append(path)
+    return files
+
+class EventWriter:
+    """
+    Writes progress events as JSON lines to the real stdout.
+    """
+    def __init__(self, stream):
+        self.stream = stream
+
+    def emit(self, event, **fields):
+        self.stream.write(json.dumps({"event": event, "time": time.strftime("%Y-%m-%dT%H:%M:%S"), **fields},
+                                     ensure_ascii=False, default=str) + "\n")
+        self.stream.flush()
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    countries = list(dict.fromkeys(args.country or [DEFAULT_COUNTRY]))
+
+    configure_environment(args)
+    # Imported only now so the engine modules pick up the configured cache locations
+    from NewsParallel import run_countries
+    from NewsPipeline import DIGEST_STAGES, run_country
+    from NewsProgress import set_progress_sink
+
+    only = None
+    if args.stages:
+        only = [stage.strip() for stage in args.stages.split(",") if stage.strip()]
+        unknown = [stage for stage in only if stage not in DIGEST_STAGES]
+        if unknown:
+            parser.error(f"unknown stage(s): {', '.join(unknown)}")
+
+    events = EventWriter(sys.stdout)
+    # Keep stdout for the JSON events; the pipeline's own messages go to stderr
+    sys.stdout = sys.stderr
+
+    country_files = {country: expand_inputs(args.inputs, load_profile(country)) for country in countries}
+    empty = [country for country, files in country_files.items() if not files]
+    if empty:
+        events.emit("error", message=f"No input files matched for {', '.join(empty)}")
+        return EXIT_NO_INPUT
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    events.emit("start", countries=countries, inputs={country: len(files) for country, files in country_files.items()},
+                output_dir=os.path.abspath(args.output_dir), stages=only or list(DIGEST_STAGES))
+    training_data_path = os.path.abspath(args.training_data)
+    options = {"force": args.force, "only": only, "logo_path": args.logo, "output_dir": args.output_dir}
+    try:
+        if len(countries) == 1:
+            country = countries[0]
+
+            def on_stage(name, status):
+                events.emit("stage", country=country, stage=name, status=status)
+
+            set_progress_sink(lambda event: events.emit("progress", country=country, **event.as_dict()))
+            try:
+                results = {country: run_country(country, country_files[country], training_data_path, on_stage=on_stage, **options)}
+                events.emit("done", country=country, stages=results[country])
+            except Exception as e:
+                traceback.print_exc()
+                results = {country: e}
+                events.emit("failed", country=country, error=str(e))
+        else:
+            partial_lines = {country: "" for country in countries}
+
+            def on_event(country, kind, value):
+                if kind == "output":
+                    # Prefix each complete line so the interleaved logs of the countries stay readable
+                    *lines, partial_lines[country] = (partial_lines[country] + value).split("\n")
+                    sys.stderr.write("".join(f"[{country}] {line}\n" for line in lines))
+                elif kind == "progress":
+                    events.emit("progress", country=country, **value)
+                elif kind == "stage":
+                    events.emit("stage", country=country, stage=value[0], status=value[1])
+                elif kind in ("done", "failed"):
+                    # The country has stopped printing: write a last line that had no newline
+                    if partial_lines[country]:
+                        sys.stderr.write(f"[{country}] {partial_lines[country]}\n")
+                        partial_lines[country] = ""
+                    if kind == "done":
+                        events.emit("done", country=country, stages=value)
+                    else:
+                        events.emit("failed", country=country, error=value)
+
+            results = run_countries(country_files, training_data_path, on_event, max_workers=args.jobs, **options)
+    except KeyboardInterrupt:
+        events.emit("finished", exit_code=EXIT_INTERRUPTED)
+        return EXIT_INTERRUPTED
+
+    failed = [country for country, result in results.items() if isinstance(result, Exception)]
+    exit_code = EXIT_FAILED if failed else EXIT_OK
+    events.emit("finished", exit_code=exit_code, failed=failed)
+    return exit_code
+
+if __name__ == "__main__":
+    # Needed for the country worker processes in a frozen build
+    import multiprocessing
+    multiprocessing.freeze_support()
+    sys.exit(main())
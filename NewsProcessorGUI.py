@@ -2,10 +2,31 @@ import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 import os
 import sys
-import pandas as pd
 from typing import List
 import threading
 import queue
+import multiprocessing
+from NewsCancellation import CancellationToken, PipelineCancelled, set_cancellation_token
+from NewsCountryProfiles import DEFAULT_COUNTRY, available_countries
+from NewsLogBuffer import MAX_TERMINAL_LINES, LogBuffer, run_log_path
+from NewsParallel import run_countries
+from NewsPipeline import CACHED, RESTORED, RUNNING, find_training_files, run_country
+from NewsProgress import ProgressEvent, set_progress_sink
+
+# Status shown while each pipeline stage runs, in pipeline order
+STAGE_MESSAGES = {
+    "extract": "Extracting news from files...",
+    "chain": "Chaining related stories...",
+    "merge": "Merging stories...",
+    "summarise": "Generating summaries... This can take awhile for a month of news, give it 15-30 minutes...",
+    "digest": "Creating monthly digest...",
+    "render": "Rendering Word, HTML and text digests..."
+}
+
+def stage_fraction(event):
+    """Pipeline progress in stages (0-6), counting the running stage by its share of items done"""
+    share = event.done / event.total if event.total else 1
+    return list(STAGE_MESSAGES).index(event.stage) + min(share, 1)
 
 class NewsProcessorApp:
     def __init__(self, root):
@@ -13,13 +34,23 @@ class NewsProcessorApp:
         self.root.title("Mundus News Digest Generator")
         self.root.geometry("800x600")
         
-        # Initialize variables
-        self.selected_files: List[str] = []
-        self.selected_country = tk.StringVar(value="Sweden")
+        # Initialize variables; each country keeps its own file selection
+        self.country_files = {country: [] for country in available_countries()}
+        self.selected_country = tk.StringVar(value=DEFAULT_COUNTRY)
+        self.reuse_stages = tk.BooleanVar(value=True)
+        self.run_all_countries = tk.BooleanVar(value=False)
+        # Country -> (progress bar, status label, log) while running all countries
+        self.country_rows = {}
         self.training_data_path = os.path.join(os.path.dirname(__file__), "TrainingData")
+        # Cancels or pauses the run in progress (None when idle)
+        self.token = None
+        # Output of the run in progress, written to its log file and shown once per tick:
+        # None for the main log, a country for its log tab
+        self.log_buffers = {}
         
         # Create the main frame
         self.create_widgets()
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
         
     def create_widgets(self):
         # Create top frame for country selection
@@ -29,9 +60,16 @@ class NewsProcessorApp:
         # Country selection dropdown
         ttk.Label(top_frame, text="Select Country:").pack(side=tk.LEFT, padx=5)
         country_dropdown = ttk.Combobox(top_frame, textvariable=self.selected_country, 
-                                      values=["Sweden", "Finland", "Poland"], 
+                                      values=available_countries(), 
                                       state="readonly", width=20)
         country_dropdown.pack(side=tk.LEFT, padx=5)
+        country_dropdown.bind("<<ComboboxSelected>>", lambda event: self.show_country_files())
+        
+        # Reuse the outputs of stages whose inputs have not changed since their last run
+        ttk.Checkbutton(top_frame, text="Skip unchanged stages", variable=self.reuse_stages).pack(side=tk.LEFT, padx=15)
+        
+        # Run every country that has files selected, each in its own process
+        ttk.Checkbutton(top_frame, text="Run all countries in parallel", variable=self.run_all_countries).pack(side=tk.LEFT, padx=5)
         
         # Create main content frame
         content_frame = ttk.Frame(self.root)
@@ -61,23 +99,62 @@ class NewsProcessorApp:
                                    command=self.remove_selected_file, bg="#1976D2", fg="white", activebackground="#1565C0", activeforeground="white")
         remove_file_btn.pack(pady=5)
         
-        # Process button
-        self.process_btn = tk.Button(content_frame, text="Generate Monthly Digest", 
+        # Process, pause and cancel buttons
+        run_frame = ttk.Frame(content_frame)
+        run_frame.pack(pady=20)
+        self.process_btn = tk.Button(run_frame, text="Generate Monthly Digest", 
                                command=self.start_processing, bg="#1976D2", fg="white", activebackground="#1565C0", activeforeground="white")
-        self.process_btn.pack(pady=20)
+        self.process_btn.pack(side=tk.LEFT, padx=5)
+        self.pause_btn = tk.Button(run_frame, text="Pause", command=self.toggle_pause, state=tk.DISABLED,
+                                   bg="#1976D2", fg="white", activebackground="#1565C0", activeforeground="white")
+        self.pause_btn.pack(side=tk.LEFT, padx=5)
+        self.cancel_btn = tk.Button(run_frame, text="Cancel", command=self.cancel_processing, state=tk.DISABLED,
+                                    bg="#1976D2", fg="white", activebackground="#1565C0", activeforeground="white")
+        self.cancel_btn.pack(side=tk.LEFT, padx=5)
         
         # Progress bar
         self.progress = ttk.Progressbar(content_frame, orient="horizontal", length=400, mode="determinate", maximum=6)
         self.progress.pack(pady=5)
         
-        # Terminal output display
-        self.terminal_output = tk.Text(content_frame, height=12, width=100, state="disabled", bg="white", fg="black")
-        self.terminal_output.pack(fill=tk.BOTH, expand=True, pady=5)
+        # Progress of the running stage: items done, throughput and ETA
+        self.stage_progress = ttk.Progressbar(content_frame, orient="horizontal", length=400, mode="determinate")
+        self.stage_progress.pack(pady=2)
+        self.stage_progress_label = ttk.Label(content_frame, text="")
+        self.stage_progress_label.pack(pady=2)
+        
+        # Which pipeline stages were skipped because their inputs had not changed
+        self.stages_label = ttk.Label(content_frame, text="")
+        self.stages_label.pack(pady=2)
+        
+        # One progress bar and status per country when running all countries
+        self.countries_frame = ttk.Frame(content_frame)
+        self.countries_frame.pack(fill=tk.X)
+        
+        # Terminal output display; running all countries adds one log tab per country
+        self.log_tabs = ttk.Notebook(content_frame)
+        self.log_tabs.pack(fill=tk.BOTH, expand=True, pady=5)
+        self.terminal_output = self.create_log(self.log_tabs, "Log")
         
         # Status label
         self.status_label = ttk.Label(content_frame, text="Ready")
         self.status_label.pack(pady=5)
         
+    def create_log(self, notebook, title):
+        log = tk.Text(notebook, height=12, width=100, state="disabled", bg="white", fg="black")
+        notebook.add(log, text=title)
+        return log
+    
+    @property
+    def selected_files(self) -> List[str]:
+        """Files selected for the country currently shown in the dropdown"""
+        return self.country_files.setdefault(self.selected_country.get(), [])
+    
+    def show_country_files(self):
+        """Show the file selection of the newly selected country"""
+        self.files_listbox.delete(0, tk.END)
+        for file in self.selected_files:
+            self.files_listbox.insert(tk.END, os.path.basename(file))
+    
     def select_files(self):
         """Open file dialog to select markdown files"""
         files = filedialog.askopenfilenames(
@@ -109,78 +186,163 @@ class NewsProcessorApp:
         self.status_label.config(text=message)
         self.root.update_idletasks()
     
-    def get_country_module_prefix(self, country: str) -> str:
-        """Get the module prefix based on the selected country"""
-        return "" if country == "Sweden" else f"{country}"
-    
     def get_training_files(self, country: str) -> List[str]:
         """Get the list of training files (shared for all countries)"""
-        training_files = []
-        # Look for all TrainingData*.xlsx files in the TrainingData directory
-        for file in os.listdir(self.training_data_path):
-            if file.startswith("TrainingData") and file.endswith(".xlsx"):
-                training_files.append(os.path.join(self.training_data_path, file))
-        if not training_files:
-            raise FileNotFoundError("No training data files found!")
-        return training_files
+        return find_training_files(self.training_data_path)
+    
+    def create_country_rows(self, countries):
+        """Replace the per-country progress bars and log tabs with one for each country about to run"""
+        for widget in self.countries_frame.winfo_children():
+            widget.destroy()
+        for _, _, log in self.country_rows.values():
+            self.log_tabs.forget(log)
+        self.country_rows = {}
+        for row, country in enumerate(countries):
+            ttk.Label(self.countries_frame, text=country, width=12).grid(row=row, column=0, sticky="w")
+            bar = ttk.Progressbar(self.countries_frame, orient="horizontal", length=250, mode="determinate", maximum=len(STAGE_MESSAGES))
+            bar.grid(row=row, column=1, padx=5, pady=1)
+            status = ttk.Label(self.countries_frame, text="Waiting...")
+            status.grid(row=row, column=2, sticky="w")
+            self.country_rows[country] = (bar, status, self.create_log(self.log_tabs, country))
     
     def start_processing(self):
         self.process_btn.config(state=tk.DISABLED)
+        self.token = CancellationToken()
+        self.pause_btn.config(state=tk.NORMAL, text="Pause")
+        self.cancel_btn.config(state=tk.NORMAL)
+        self.stages_label.config(text="")
+        self.stage_progress['value'] = 0
+        self.stage_progress_label.config(text="")
+        self.log_buffers = {None: LogBuffer(run_log_path())}
+        # A single-country run clears the rows and log tabs left by an earlier parallel run
+        parallel = self.run_all_countries.get()
+        self.create_country_rows([country for country, files in self.country_files.items() if files] if parallel else [])
+        for country in self.country_rows:
+            self.log_buffers[country] = LogBuffer(run_log_path(country))
         self.output_queue = queue.Queue()
         thread = threading.Thread(target=self.process_files_thread, args=(self.output_queue,))
         thread.start()
         self.root.after(100, self.process_queue, self.output_queue)
 
+    def toggle_pause(self):
+        """Pause the run after the requests in flight, or resume it"""
+        if self.token.paused:
+            self.token.resume()
+            self.pause_btn.config(text="Pause")
+            self.status_label.config(text="Resuming...")
+        else:
+            self.token.pause()
+            self.pause_btn.config(text="Resume")
+            self.status_label.config(text="Paused: requests in flight finish and are saved. Press Resume to continue")
+    
+    def cancel_processing(self):
+        """Stop the run after the requests in flight; finished summaries are kept for the next run"""
+        self.token.cancel()
+        self.pause_btn.config(state=tk.DISABLED)
+        self.cancel_btn.config(state=tk.DISABLED)
+        self.status_label.config(text="Cancelling: waiting for requests in flight...")
+    
+    def on_close(self):
+        # A running pipeline stops at its next checkpoint and saves its summaries before the app exits
+        if self.token:
+            self.token.cancel()
+        self.root.destroy()
+
     def process_files_thread(self, output_queue):
-        def queue_write(s):
-            output_queue.put(('output', s))
         def queue_status(s):
             output_queue.put(('status', s))
         def queue_progress(val):
             output_queue.put(('progress', val))
+        def queue_stages(s):
+            output_queue.put(('stages', s))
+        def queue_country(country, kind, value):
+            output_queue.put(('country', (country, kind, value)))
+        def queue_stage_progress(event):
+            output_queue.put(('stage_progress', event))
         def queue_done():
             output_queue.put(('done', None))
 
-        # Patch sys.stdout and sys.stderr
-        class QueueRedirector:
-            def write(self, s):
-                queue_write(s)
-            def flush(self):
-                pass
-
+        # Patch sys.stdout and sys.stderr; the Tk thread shows what is written once per tick
         old_stdout, old_stderr = sys.stdout, sys.stderr
-        sys.stdout = QueueRedirector()
-        sys.stderr = QueueRedirector()
+        sys.stdout = sys.stderr = self.log_buffers[None]
+        set_progress_sink(queue_stage_progress)
+        set_cancellation_token(self.token)
 
         try:
-            self._process_files(queue_status, queue_progress)
+            if self.run_all_countries.get():
+                self._process_all_countries(queue_status, queue_progress, queue_country)
+            else:
+                self._process_files(queue_status, queue_progress, queue_stages)
+        except PipelineCancelled:
+            queue_status("Cancelled. Finished summaries are kept and reused by the next run")
         except Exception as e:
             queue_status(f"Error: {str(e)}")
         finally:
             sys.stdout = old_stdout
             sys.stderr = old_stderr
+            set_progress_sink(None)
+            set_cancellation_token(None)
             queue_done()
 
     def process_queue(self, output_queue):
+        done = False
         try:
             while True:
                 msg_type, value = output_queue.get_nowait()
-                if msg_type == 'output':
-                    self.terminal_output.configure(state="normal")
-                    self.terminal_output.insert(tk.END, value)
-                    self.terminal_output.see(tk.END)
-                    self.terminal_output.configure(state="disabled")
-                elif msg_type == 'status':
+                if msg_type == 'status':
                     self.status_label.config(text=value)
                 elif msg_type == 'progress':
                     self.progress['value'] = value
+                elif msg_type == 'stages':
+                    self.stages_label.config(text=value)
+                elif msg_type == 'stage_progress':
+                    self.stage_progress['maximum'] = max(value.total, 1)
+                    self.stage_progress['value'] = value.done
+                    self.stage_progress_label.config(text=f"{value.stage.capitalize()}: {value.describe()}")
+                    # Move the main bar within the running stage too, not only between stages
+                    self.progress['value'] = stage_fraction(value)
+                elif msg_type == 'country':
+                    country, kind, value = value
+                    bar, status, log = self.country_rows[country]
+                    if kind == 'progress':
+                        bar['value'] = value
+                    elif kind == 'status':
+                        status.config(text=value)
                 elif msg_type == 'done':
-                    self.process_btn.config(state=tk.NORMAL)
-                    return
+                    done = True
+                    break
         except queue.Empty:
+            pass
+
+        # Everything the run printed since the last tick, in one insert per log
+        for country, buffer in self.log_buffers.items():
+            log = self.terminal_output if country is None else self.country_rows[country][2]
+            self.append_output(log, buffer.drain())
+        if not done:
             self.root.after(100, self.process_queue, output_queue)
+            return
+
+        for buffer in self.log_buffers.values():
+            buffer.close()
+        self.append_output(self.terminal_output, f"📄 Full log saved to {self.log_buffers[None].log_path}\n")
+        self.process_btn.config(state=tk.NORMAL)
+        self.pause_btn.config(state=tk.DISABLED, text="Pause")
+        self.cancel_btn.config(state=tk.DISABLED)
+        self.token = None
 
-    def _process_files(self, queue_status, queue_progress):
+    def append_output(self, log, text):
+        if not text:
+            return
+        log.configure(state="normal")
+        log.insert(tk.END, text)
+        # Keep only the latest lines in the pane; the log file has all of them
+        excess = int(log.index("end-1c").split(".")[0]) - MAX_TERMINAL_LINES
+        if excess > 0:
+            log.delete("1.0", f"{excess + 1}.0")
+        log.see(tk.END)
+        log.configure(state="disabled")
+
+    def _process_files(self, queue_status, queue_progress, queue_stages):
         # This is the original process_files logic, but with status/progress updates via the queue
         if not self.selected_files:
             queue_status("Please select at least one file to process")
@@ -189,79 +351,75 @@ class NewsProcessorApp:
         queue_status(f"Processing files for {country}...")
         queue_progress(0)
         # Reset terminal output is handled in the main thread
-        prefix = self.get_country_module_prefix(country)
-        if country == "Sweden":
-            from NewsToCsv import process_markdown_files, save_to_csv, save_to_excel
-            from NewsChainer import find_related_articles, format_chained_articles, save_chained_articles
-            from NewsMerger import merge_story_groups
-            from NewsSummariser import summarise_merged_stories
-            from NewsDigestor import generate_monthly_digest
-            from NewsToDocx import convert_markdown_to_word
-        else:
-            module_names = [
-                "ToCsv", "Chainer", "Merger", "SummariserThirdPass", 
-                "Digestor", "ToDocx"
-            ]
-            for module_name in module_names:
-                full_module_name = f"{prefix}News{module_name}"
-                __import__(full_module_name)
-            process_markdown_files = getattr(sys.modules[f"{prefix}NewsToCsv"], "process_markdown_files")
-            save_to_csv = getattr(sys.modules[f"{prefix}NewsToCsv"], "save_to_csv")
-            save_to_excel = getattr(sys.modules[f"{prefix}NewsToCsv"], "save_to_excel")
-            find_related_articles = getattr(sys.modules[f"{prefix}NewsChainer"], "find_related_articles")
-            format_chained_articles = getattr(sys.modules[f"{prefix}NewsChainer"], "format_chained_articles")
-            save_chained_articles = getattr(sys.modules[f"{prefix}NewsChainer"], "save_chained_articles")
-            merge_story_groups = getattr(sys.modules[f"{prefix}NewsMerger"], "merge_story_groups")
-            summarise_merged_stories = getattr(sys.modules[f"{prefix}NewsSummariserThirdPass"], "summarise_merged_stories")
-            generate_monthly_digest = getattr(sys.modules[f"{prefix}NewsDigestor"], "generate_monthly_digest")
-            convert_markdown_to_word = getattr(sys.modules[f"{prefix}NewsToDocx"], "convert_markdown_to_word")
-        country_lower = country.lower()
-        extracted_news_csv = f"extracted_news_{country_lower}.csv"
-        extracted_news_xlsx = f"extracted_news_{country_lower}.xlsx"
-        chained_news_csv = f"chained_news_{country_lower}.csv"
-        summarised_stories_xlsx = f"summarised_stories_{country_lower}.xlsx"
-        monthly_digest_md = f"Monthly_News_Digest_{country}.md"
-        monthly_digest_docx = f"Monthly_News_Digest_{country}.docx"
-        training_files = self.get_training_files(country)
-        queue_status("Extracting news from files...")
-        all_articles = process_markdown_files(self.selected_files)
-        save_to_csv(all_articles, extracted_news_csv)
-        save_to_excel(all_articles, extracted_news_xlsx)
-        queue_progress(1)
-        queue_status("Chaining related stories...")
-        articles_df = pd.read_csv(extracted_news_csv)
-        grouped_articles, article_index_map = find_related_articles(articles_df)
-        chained_articles = format_chained_articles(grouped_articles, article_index_map)
-        save_chained_articles(chained_articles, chained_news_csv)
-        queue_progress(2)
-        queue_status("Merging stories...")
-        merge_story_groups(chained_news_csv)
-        queue_progress(3)
-        queue_status("Generating summaries... This can take awhile for a month of news, give it 15-30 minutes...")
-        summarise_merged_stories(
-            output_csv=f"summarised_stories_{country_lower}.csv",
-            output_excel=f"summarised_stories_{country_lower}.xlsx"
-        )
-        queue_progress(4)
-        queue_status("Creating monthly digest...")
-        generate_monthly_digest(
-            summarised_stories_xlsx,
-            monthly_digest_md,
-            training_files
-        )
-        queue_progress(5)
-        queue_status("Converting to Word document...")
-        convert_markdown_to_word(
-            monthly_digest_md,
-            monthly_digest_docx,
-            "Mundus_Icon.png"
-        )
-        queue_progress(6)
+        # One engine for every country; the country profile supplies categories, prompts and file names
+        cache_hits = []
+
+        def on_stage(name, status):
+            if status == RUNNING:
+                queue_status(STAGE_MESSAGES[name])
+                return
+            if status in (CACHED, RESTORED):
+                cache_hits.append(name if status == CACHED else f"{name} (artifact store)")
+                queue_stages(f"Reused unchanged stages: {', '.join(cache_hits)}")
+            queue_progress(list(STAGE_MESSAGES).index(name) + 1)
+
+        run_country(country, self.selected_files, self.training_data_path, on_stage=on_stage, force=not self.reuse_stages.get())
+        if not cache_hits:
+            queue_stages("All stages ran")
         queue_status("Process completed successfully!")
         # Optionally, show a messagebox in the main thread
         self.root.after(0, lambda: messagebox.showinfo("Success", f"Monthly digest for {country} has been generated successfully!"))
 
+    def _process_all_countries(self, queue_status, queue_progress, queue_country):
+        country_files = {country: list(files) for country, files in self.country_files.items() if files}
+        if not country_files:
+            queue_status("Please select files for at least one country")
+            return
+        queue_status(f"Processing {', '.join(country_files)} in parallel...")
+        queue_progress(0)
+        cache_hits = {country: [] for country in country_files}
+        stages_done = []
+
+        def on_event(country, kind, value):
+            if kind == "output":
+                self.log_buffers[country].write(value)
+            elif kind == "progress":
+                event = ProgressEvent(**value)
+                queue_country(country, "progress", stage_fraction(event))
+                queue_country(country, "status", f"{event.stage.capitalize()}: {event.describe()}")
+            elif kind == "stage":
+                name, status = value
+                if status == RUNNING:
+                    queue_country(country, "status", STAGE_MESSAGES[name])
+                    return
+                if status in (CACHED, RESTORED):
+                    cache_hits[country].append(name)
+                queue_country(country, "progress", list(STAGE_MESSAGES).index(name) + 1)
+                # The main progress bar (one step per stage) averages the countries' progress
+                stages_done.append(name)
+                queue_progress(len(stages_done) / len(country_files))
+            elif kind == "done":
+                reused = f" (reused: {', '.join(cache_hits[country])})" if cache_hits[country] else ""
+                queue_country(country, "status", f"Completed{reused}")
+            elif kind == "cancelled":
+                queue_country(country, "status", "Cancelled")
+            elif kind == "failed":
+                queue_country(country, "status", f"Error: {value}")
+
+        results = run_countries(country_files, self.training_data_path, on_event, token=self.token,
+                                force=not self.reuse_stages.get())
+        if any(isinstance(result, PipelineCancelled) for result in results.values()):
+            raise PipelineCancelled()
+        failed = [country for country, result in results.items() if isinstance(result, Exception)]
+        if failed:
+            queue_status(f"Finished with errors for {', '.join(failed)}; see their log tabs")
+            return
+        queue_status("Process completed successfully!")
+        self.root.after(0, lambda: messagebox.showinfo("Success", f"Monthly digests for {', '.join(results)} have been generated successfully!"))
+
 if __name__ == "__main__":
+    # Needed for the country worker processes in the frozen (PyInstaller) app
+    multiprocessing.freeze_support()
     root = tk.Tk()
     app = NewsProcessorApp(root)
     root.mainloop() 
\ No newline at end of file
@@ -0,0 +1,128 @@
+import threading
+import time
+from dataclasses import dataclass, asdict
+from NewsTelemetry import record_stat
+
+# Weight of the latest throughput measurement in the moving average the ETA is based on
+RATE_SMOOTHING = 0.3
+# Minimum seconds between two events of one tracker (the first and last are always sent),
+# and the shortest window throughput is measured over
+MIN_EVENT_INTERVAL = 0.25
+
+@dataclass
+class ProgressEvent:
+    stage: str
+    unit: str
+    done: int
+    total: int
+    elapsed: float
+    rate: float          # Items per second, exponential moving average
+    eta: object          # Seconds left at the current rate, None until there is a rate
+    finished: bool = False
+
+    def as_dict(self):
+        return asdict(self)
+
+    def describe(self):
+        """
+        Short human-readable line, e.g. "120/450 story groups · 2.3/s · ETA 2m 24s".
+        """
+        text = f"{self.done}/{self.total} {self.unit}"
+        if self.rate:
+            text += f" · {self.rate:.1f}/s"
+        if self.finished:
+            return f"{text} · done in {format_duration(self.elapsed)}"
+        if self.eta is not None:
+            text += f" · ETA {format_duration(self.eta)}"
+        return text
+
+def format_duration(seconds):
+    seconds = int(round(seconds))
+    if seconds < 60:
+        return f"{seconds}s"
+    if seconds < 3600:
+        return f"{seconds // 60}m {seconds % 60:02d}s"
+    return f"{seconds // 3600}h {seconds % 3600 // 60:02d}m"
+
+# Receives every ProgressEvent of this process (set by the GUI, the CLI or a country worker process)
+_sink = None
+_sink_lock = threading.Lock()
+
+def set_progress_sink(sink):
+    """
+    Sends every progress event of this process to sink(event); None stops sending them.
+    """
+    global _sink
+    with _sink_lock:
+        _sink = sink
+
+def _emit(event):
+    with _sink_lock:
+        sink = _sink
+    if sink is not None:
+        sink(event)
+
+class ProgressTracker:
+    """
+    Counts the items of one stage (safe to advance from worker threads) and emits ProgressEvents with
+    throughput and ETA to the progress sink. finish() records the stage's item count and throughput
+    in the run report.
+    """
+
+    def __init__(self, stage, total, unit="items"):
+        self.stage = stage
+        self.total = total
+        self.unit = unit
+        self.done = 0
+        self.rate = 0.0
+        self.started = time.perf_counter()
+        self._last_time = self.started
+        self._last_done = 0
+        self._last_emit = None
+        self._lock = threading.Lock()
+        self._send(force=True)
+
+    def advance(self, count=1):
+        with self._lock:
+            self.done += count
+            now = time.perf_counter()
+            # Measure over windows of at least MIN_EVENT_INTERVAL, so items finishing together on
+            # several threads do not read as a burst of very high throughput
+            if now - self._last_time >= MIN_EVENT_INTERVAL or (self.done >= self.total and now > self._last_time):
+                instant = (self.done - self._last_done) / (now - self._last_time)
+                self.rate = instant if not self.rate else RATE_SMOOTHING * instant + (1 - RATE_SMOOTHING) * self.rate
+                self._last_time, self._last_done = now, self.done
+        self._send(force=self.done >= self.total)
+
+    def _event(self, finished=False):
+        with self._lock:
+            remaining = max(self.total - self.done, 0)
+            eta = remaining / self.rate if self.rate else None
+            return ProgressEvent(self.stage, self.unit, self.done, self.total,
+                                 round(time.perf_counter() - self.started, 3), round(self.rate, 3),
+                                 None if eta is None else round(eta, 1), finished)
+
+    def _send(self, force=False):
+        now = time.perf_counter()
+        with self._lock:
+            if not force and self._last_emit is not None and now - self._last_emit < MIN_EVENT_INTERVAL:
+                return
+            self._last_emit = now
+        _emit(self._event())
+
+    def flush(self):
+        """
+        Sends the current count now, even if advance() was throttled (e.g. while the run is paused).
+        """
+        self._send(force=True)
+
+    def finish(self):
+        event = self._event(finished=True)
+        record_stat("progress", self.stage, {
+            "unit": self.unit,
+            "items": event.done,
+            "seconds": event.elapsed,
+            "items_per_s": round(event.done / event.elapsed, 3) if event.elapsed else 0.0
+        })
+        _emit(event)
+        return event
@@ -0,0 +1,106 @@
+import re
+from NewsTelemetry import estimate_tokens, record_compaction
+
+# Upper bound on characters kept per article after compaction
+MAX_ARTICLE_CHARS = 2500
+
+# max_tokens per summary tier, sized for the requested length with headroom so replies are not cut off
+SUMMARY_MAX_TOKENS = {
+    "short": 150,      # 1-2 sentences
+    "medium": 300,     # 2-4 sentences
+    "paragraph": 600   # full paragraph
+}
+
+# Articles in a merged story start with "(13 February 2025) Headline:" (see NewsMerger)
+ARTICLE_SPLIT_PATTERN = re.compile(r"\n\n(?=\([^()\n]*\) [^\n]*:\n)")
+SENTENCE_SPLIT_PATTERN = re.compile(r"(?<=[.!?])\s+")
+
+def get_summary_tier(dates):
+    """
+    Maps the number of attached dates to a summary length tier.
+    """
+    num_dates = len(dates.split(", "))
+
+    if num_dates == 1:
+        return "short"
+    elif num_dates == 2:
+        return "medium"
+    else:
+        return "paragraph"
+
+def summary_max_tokens(dates):
+    """
+    Returns the max_tokens budget for a summary based on its length tier.
+    """
+    return SUMMARY_MAX_TOKENS[get_summary_tier(dates)]
+
+def category_max_tokens(categories_list):
+    """
+    Returns a max_tokens budget just large enough for the longest category name.
+    """
+    return max(estimate_tokens(category) for category in categories_list) * 2 + 10
+
+def strip_markdown(text):
+    """
+    Removes Markdown noise (emphasis, headings, links, bullets, inline code, HTML tags)
+    and collapses repeated whitespace.
+    """
+    text = re.sub(r"!\[[^\]]*\]\([^)]*\)", "", text)        # Images
+    text = re.sub(r"\[([^\]]*)\]\([^)]*\)", r"\1", text)     # Links -> link text
+    text = re.sub(r"<[^>]+>", "", text)                      # HTML tags
+    text = re.sub(r"(\*\*|__|\*|`)", "", text)               # Emphasis and inline code
+    text = re.sub(r"^\s{0,3}(#{1,6}|[-+>]|\d+\.)\s+", "", text, flags=re.MULTILINE)  # Headings, bullets, quotes
+    text = re.sub(r"[ \t]+", " ", text)
+    text = re.sub(r"\n\s*\n+", "\n", text)
+    return text.strip()
+
+def _sentence_key(sentence):
+    return re.sub(r"[^\w]+", " ", sentence.lower()).strip()
+
+def cap_text(text, max_chars):
+    """
+    Truncates text to at most max_chars, cutting at the last sentence boundary where possible.
+    """
+    if len(text) <= max_chars:
+        return text
+    cut = text[:max_chars]
+    boundary = max(cut.rfind(". "), cut.rfind("! "), cut.rfind("? "))
+    return cut[:boundary + 1] if boundary > max_chars // 2 else cut.rstrip() + "…"
+
+def compact_story(full_story, max_article_chars=MAX_ARTICLE_CHARS):
+    """
+    Compacts a merged story before it is sent to the LLM: strips Markdown noise,
+    drops sentences already seen in an earlier article of the group, and caps each article.
+    """
+    seen_sentences = set()
+    compacted_articles = []
+
+    for article in ARTICLE_SPLIT_PATTERN.split(str(full_story)):
+        header, _, body = article.partition("\n")
+        if not body:
+            header, body = "", header
+
+        kept_sentences = []
+        for sentence in SENTENCE_SPLIT_PATTERN.split(strip_markdown(body).replace("\n", " ")):
+            key = _sentence_key(sentence)
+            if not key or key in seen_sentences:
+                continue
+            seen_sentences.add(key)
+            kept_sentences.append(sentence.strip())
+
+        if not kept_sentences:
+            continue
+        body = cap_text(" ".join(kept_sentences), max_article_chars)
+        compacted_articles.append(f"{strip_markdown(header)}\n{body}" if header else body)
+
+    return "\n\n".join(compacted_articles)
+
+def log_compaction(stage, story_group, original, compacted):
+    """
+    Logs and records the estimated token counts before and after compaction.
+    """
+    before = estimate_tokens(original)
+    after = estimate_tokens(compacted)
+    record_compaction(stage, before, after)
+    saved = (1 - after / before) * 100 if before else 0.0
+    print(f"✂️ {stage} input for Story Group {story_group}: {before} → {after} tokens ({saved:.0f}% saved)")
@@ -0,0 +1,49 @@
+import os
+import threading
+import time
+
+# OpenAI account quota shared by every run using the same limiter
+REQUESTS_PER_MINUTE = int(os.getenv("NEWS_LLM_REQUESTS_PER_MINUTE", "500"))
+TOKENS_PER_MINUTE = int(os.getenv("NEWS_LLM_TOKENS_PER_MINUTE", "200000"))
+
+class RateLimiter:
+    """
+    Token buckets for requests and tokens per minute. With state and lock from a multiprocessing
+    Manager (see shared_rate_limiter) one limiter is shared by every process it is passed to.
+    """
+
+    def __init__(self, requests_per_minute=REQUESTS_PER_MINUTE, tokens_per_minute=TOKENS_PER_MINUTE, state=None, lock=None):
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.state = {} if state is None else state
+        self.lock = lock if lock is not None else threading.Lock()
+        # Start with full buckets
+        self.state.update(requests=float(requests_per_minute), tokens=float(tokens_per_minute), updated=time.time())
+
+    def acquire(self, tokens):
+        """
+        Blocks until one request of about `tokens` tokens fits in both buckets, then takes it.
+        Returns the seconds spent waiting.
+        """
+        # A single request larger than the whole budget still has to go through eventually
+        tokens = min(tokens, self.tokens_per_minute)
+        waited = 0.0
+        while True:
+            with self.lock:
+                now = time.time()
+                elapsed = now - self.state["updated"]
+                requests = min(self.requests_per_minute, self.state["requests"] + elapsed * self.requests_per_minute / 60)
+                budget = min(self.tokens_per_minute, self.state["tokens"] + elapsed * self.tokens_per_minute / 60)
+                if requests >= 1 and budget >= tokens:
+                    self.state.update(requests=requests - 1, tokens=budget - tokens, updated=now)
+                    return waited
+                self.state.update(requests=requests, tokens=budget, updated=now)
+                wait = max((1 - requests) * 60 / self.requests_per_minute, (tokens - budget) * 60 / self.tokens_per_minute)
+            time.sleep(wait)
+            waited += wait
+
+def shared_rate_limiter(manager, requests_per_minute=REQUESTS_PER_MINUTE, tokens_per_minute=TOKENS_PER_MINUTE):
+    """
+    Creates a RateLimiter whose state lives in a multiprocessing Manager, so it can be passed to worker processes.
+    """
+    return RateLimiter(requests_per_minute, tokens_per_minute, state=manager.dict(), lock=manager.Lock())
@@ -0,0 +1,35 @@
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from NewsTelemetry import estimate_tokens
+
+# Default number of story groups summarised concurrently
+SUMMARY_WORKERS = int(os.getenv("NEWS_SUMMARY_WORKERS", "4"))
+
+# Extra cost per attached date: more dates mean a longer summary tier and more articles
+DATE_COST_TOKENS = 400
+
+def estimate_job_cost(full_story, dates):
+    """
+    Estimates the relative cost of summarising a story group from its input tokens and date count.
+    """
+    return estimate_tokens(str(full_story)) + DATE_COST_TOKENS * len(str(dates).split(", "))
+
+def run_longest_first(jobs, worker, costs, max_workers=SUMMARY_WORKERS, on_done=None):
+    """
+    Runs worker(job) for every job on a thread pool, submitting the most expensive jobs first
+    so one large story group cannot start last and decide the total runtime.
+    on_done() is called as each job finishes (e.g. to advance a ProgressTracker).
+    Results are returned in the original job order.
+    """
+    # Stable sort: jobs with equal cost keep their input order
+    order = sorted(range(len(jobs)), key=lambda i: costs[i], reverse=True)
+    results = [None] * len(jobs)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(worker, jobs[i]): i for i in order}
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+            if on_done:
+                on_done()
+
+    return results
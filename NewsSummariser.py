@@ -1,17 +1,32 @@
 import pandas as pd
-import openai
 import os
-from dotenv import load_dotenv
+from functools import partial
+from NewsTelemetry import timed_completion
+from NewsCountryProfiles import resolve_profile
+from NewsCancellation import checkpoint, is_paused
+from NewsProgress import ProgressTracker
+from NewsPrompts import compact_story, get_summary_tier, log_compaction, summary_max_tokens
+from NewsScheduler import SUMMARY_WORKERS, estimate_job_cost, run_longest_first
+from NewsSummaryCache import SUMMARY_CACHE_PATH, SummaryCache
 
-# Load OpenAI API key from .env file
-load_dotenv()
-OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
+# OpenAI client, created on first use (see get_client)
+client = None
 
-if not OPENAI_API_KEY:
-    raise ValueError("❌ OpenAI API key is missing! Check your .env file.")
-
-# OpenAI client setup
-client = openai.OpenAI(api_key=OPENAI_API_KEY)
+def get_client():
+    """
+    Returns the OpenAI client, creating it on first use with the API key from the environment or .env file,
+    so importing this module neither loads openai nor needs a key.
+    """
+    global client
+    if client is None:
+        import openai
+        from dotenv import load_dotenv
+        load_dotenv()
+        api_key = os.getenv("OPENAI_API_KEY")
+        if not api_key:
+            raise ValueError("❌ OpenAI API key is missing! Check your .env file.")
+        client = openai.OpenAI(api_key=api_key)
+    return client
 
 def extract_numeric_day(date_string):
     """
@@ -42,36 +57,38 @@ def format_dates(dates):
 
     return f"({', '.join(numeric_dates)} {month})"
 
+# Summary length instructions per tier (see NewsPrompts.get_summary_tier)
+SUMMARY_INSTRUCTIONS = {
+    "short": "Summarise the story in **1-2 sentences**.",
+    "medium": "Summarise the story in **2-4 sentences**.",
+    "paragraph": "Write a full paragraph summarising the story."
+}
+
 def get_summary_instructions(dates):
     """
     Determines the summary length instructions based on the number of attached dates.
     """
-    num_dates = len(dates.split(", "))
-
-    if num_dates == 1:
-        return "Summarise the story in **1-2 sentences**."
-    elif num_dates == 2:
-        return "Summarise the story in **2-4 sentences**."
-    else:
-        return "Write a full paragraph summarising the story."
+    return SUMMARY_INSTRUCTIONS[get_summary_tier(dates)]
 
-def generate_summary(headlines, full_story, dates):
+def generate_summary(headlines, full_story, dates, story_group=None, profile=None):
     """
     Uses OpenAI's ChatGPT API to generate a complete, structured summary based on date count.
+    Returns None when the request fails.
     """
+    profile = resolve_profile(profile)
     summary_instruction = get_summary_instructions(dates)
 
     try:
-        response = client.chat.completions.create(
+        response = timed_completion(
+            get_client(), "summary", story_group,
             model="gpt-4-turbo",
             messages=[
-                {"role": "system", "content": "You are a professional news summariser writing in British English and past tense. "
-                                              "Your summaries must always be fully complete and must never be cut off."},
+                {"role": "system", "content": profile.prompt("summary_system")},
                 {"role": "user", "content": f"{summary_instruction} Ensure the summary is concise and well-structured.\n\n"
                                             f"📝 Headlines: {headlines}\n\n📜 Full Story:\n{full_story}"
                                             f"🛑 The summary **must** be factual, clear, and use the provided token limit."}
             ],
-            max_tokens=3000,  # Fixed max tokens for all summaries
+            max_tokens=summary_max_tokens(dates),  # Sized to the summary length tier
             temperature=0.2,
             stop=["###", "\n\n"]
         )
@@ -80,17 +97,48 @@ def generate_summary(headlines, full_story, dates):
 
     except Exception as e:
         print(f"⚠️ Error generating summary: {e}")
-        return "Summary unavailable"
+        return None
 
-def generate_headline(headlines, full_story):
+def update_summary(previous_summary, additions, dates, story_group=None, profile=None):
     """
-    Uses OpenAI to generate a merged headline summarising the key event.
+    Updates a cached summary of a near-identical earlier story group with only the new material,
+    instead of summarising the whole merged story again. Returns None when the request fails.
     """
+    profile = resolve_profile(profile)
+    summary_instruction = get_summary_instructions(dates)
+
     try:
-        response = client.chat.completions.create(
+        response = timed_completion(
+            get_client(), "summary_update", story_group,
             model="gpt-4-turbo",
             messages=[
-                {"role": "system", "content": "You are an expert news summariser writing in British English."},
+                {"role": "system", "content": profile.prompt("summary_system")},
+                {"role": "user", "content": f"{summary_instruction} Update the earlier summary below so that it also covers the new developments. "
+                                            f"Ensure the summary is concise and well-structured.\n\n"
+                                            f"📜 Earlier summary:\n{previous_summary}\n\n🆕 New developments:\n{additions or 'None'}"}
+            ],
+            max_tokens=summary_max_tokens(dates),  # Sized to the summary length tier
+            temperature=0.2,
+            stop=["###", "\n\n"]
+        )
+
+        return response.choices[0].message.content.strip()
+
+    except Exception as e:
+        print(f"⚠️ Error updating summary: {e}")
+        return None
+
+def generate_headline(headlines, full_story, story_group=None, profile=None):
+    """
+    Uses OpenAI to generate a merged headline summarising the key event. Returns None when the request fails.
+    """
+    profile = resolve_profile(profile)
+    try:
+        response = timed_completion(
+            get_client(), "headline", story_group,
+            model="gpt-4-turbo",
+            messages=[
+                {"role": "system", "content": profile.prompt("headline_system")},
                 {"role": "user", "content": f"Generate a concise, professional news headline summarising the following merged news story:\n\nHeadlines: {headlines}\n\nFull Story:\n{full_story}"}
             ],
             max_tokens=300,  # Keep headlines concise
@@ -101,33 +149,94 @@ def generate_headline(headlines, full_story):
 
     except Exception as e:
         print(f"⚠️ Error generating headline: {e}")
-        return "Headline unavailable"
+        return None
+
+def summarise_story_group(row, summary_cache=None, profile=None):
+    """
+    Generates the headline and dated summary for one merged story group.
+    When a summary cache is given, near-identical earlier story groups are reused or updated instead.
+    Returns a row of [Story Group ID, Merged Headline, Summary, Dates].
+    """
+    story_group_id = row["Story Group ID"]
+    dates = row["Dates"]
+    headlines = row["Headlines"]
+    full_story = row["Merged Content"]
+
+    # Paused or cancelled runs start no new requests; those already in flight finish
+    checkpoint()
+    print(f"📝 Processing Story Group {story_group_id}...")
+
+    # Compact the merged story once; the headline and summary prompts both use it
+    compacted_story = compact_story(full_story)
+    log_compaction("summary", story_group_id, str(full_story), compacted_story)
+
+    tier = get_summary_tier(dates)
+    decision, cached, additions = summary_cache.match(compacted_story, tier) if summary_cache else ("miss", None, "")
 
-def summarise_merged_stories(input_csv="merged_stories.csv", output_csv="summarised_stories.csv", output_excel="summarised_stories.xlsx"):
+    if decision == "reuse":
+        print(f"♻️ Story Group {story_group_id}: reusing cached summary")
+        merged_headline, summary = cached["headline"], cached["summary"]
+    elif decision == "update":
+        print(f"♻️ Story Group {story_group_id}: updating cached summary with new material")
+        merged_headline = cached["headline"]
+        summary = update_summary(cached["summary"], additions, dates, story_group_id, profile)
+        if summary is None:
+            # Fall back to the earlier summary, but keep it out of the cache: it lacks the new material
+            decision, summary = "reuse", cached["summary"]
+    else:
+        # Generate AI-based headline & summary
+        merged_headline = generate_headline(headlines, compacted_story, story_group_id, profile)
+        summary = generate_summary(headlines, compacted_story, dates, story_group_id, profile)
+
+    # Only complete results are cached; a failed request would otherwise be reused by later runs
+    if summary_cache and decision != "reuse" and merged_headline is not None and summary is not None:
+        summary_cache.add(compacted_story, tier, merged_headline, summary, source=story_group_id)
+    if merged_headline is None:
+        merged_headline = "Headline unavailable"
+    if summary is None:
+        summary = "Summary unavailable"
+
+    # Append the manually formatted date at the end of the summary
+    formatted_date = format_dates(dates)
+    summary += f" {formatted_date}"
+
+    return [story_group_id, merged_headline, summary, formatted_date]
+
+def summarise_merged_stories(input_csv="merged_stories.csv", output_csv="summarised_stories.csv", output_excel="summarised_stories.xlsx", max_workers=SUMMARY_WORKERS, summary_cache_path=SUMMARY_CACHE_PATH, profile=None):
     """
     Reads the merged news stories CSV, generates summaries and headlines using ChatGPT,
     appends dates manually, and saves results in a structured format.
+    Story groups are summarised concurrently, largest first, and written back in input order.
+    Earlier summaries in the semantic cache at summary_cache_path are reused (None disables it).
+    Prompt wording comes from the country profile (default: Sweden).
+    Summaries finished before a pause or cancellation are saved to the cache, so the next run reuses them.
     """
+    get_client()  # A missing API key stops the stage here rather than failing every story
     df = pd.read_csv(input_csv)
+    summary_cache = SummaryCache(summary_cache_path) if summary_cache_path else None
 
-    summaries = []
-    for _, row in df.iterrows():
-        story_group_id = row["Story Group ID"]
-        dates = row["Dates"]
-        headlines = row["Headlines"]
-        full_story = row["Merged Content"]
-
-        print(f"📝 Processing Story Group {story_group_id}...")
+    rows = [row for _, row in df.iterrows()]
+    costs = [estimate_job_cost(row["Merged Content"], row["Dates"]) for row in rows]
+    worker = partial(summarise_story_group, summary_cache=summary_cache, profile=resolve_profile(profile))
+    progress = ProgressTracker("summarise", len(rows), "story groups")
 
-        # Generate AI-based headline & summary
-        merged_headline = generate_headline(headlines, full_story)
-        summary = generate_summary(headlines, full_story, dates)
+    def on_done():
+        progress.advance()
+        # While paused, save each summary as its in-flight request drains, so closing the app loses nothing
+        if is_paused():
+            if summary_cache:
+                summary_cache.save()
+            progress.flush()
 
-        # Append the manually formatted date at the end of the summary
-        formatted_date = format_dates(dates)
-        summary += f" {formatted_date}"
+    try:
+        summaries = run_longest_first(rows, worker, costs, max_workers=max_workers, on_done=on_done)
+    finally:
+        if summary_cache:
+            summary_cache.save()
+    progress.finish()
 
-        summaries.append([story_group_id, merged_headline, summary, formatted_date])
+    if summary_cache:
+        summary_cache.report()
 
     # Convert to DataFrame
     summary_df = pd.DataFrame(summaries, columns=["Story Group ID", "Merged Headline", "Summary", "Dates"])
@@ -0,0 +1,150 @@
+import json
+import os
+import re
+import threading
+import time
+from NewsPrompts import SENTENCE_SPLIT_PATTERN
+from NewsTelemetry import record_stat
+
+# Shared by every country and month so long-running stories are only summarised once
+SUMMARY_CACHE_PATH = os.getenv("NEWS_SUMMARY_CACHE", os.path.join("summary_cache", "summary_cache.json"))
+
+# Cosine similarity above which a cached summary is reused as-is (same length tier only)
+REUSE_THRESHOLD = 0.97
+# Cosine similarity above which a cached summary is updated with the new material only
+UPDATE_THRESHOLD = 0.85
+MAX_ENTRIES = 20000
+
+DECISION_STATS = {"reuse": "reused", "update": "updated", "miss": "missed"}
+
+def _normalise(text):
+    return re.sub(r"[^\w\s]", "", str(text).lower())
+
+def _sentences(text):
+    return [s.strip() for s in SENTENCE_SPLIT_PATTERN.split(str(text).replace("\n", " ")) if s.strip()]
+
+def new_material(previous_content, content):
+    """
+    Returns the sentences of content that do not appear in previous_content.
+    """
+    seen = {_normalise(s).strip() for s in _sentences(previous_content)}
+    return " ".join(s for s in _sentences(content) if _normalise(s).strip() not in seen)
+
+class SummaryCache:
+    """
+    Semantic cache of earlier story group summaries, matched by hashed n-gram vector similarity
+    of the compacted merged content.
+    """
+
+    def __init__(self, path=SUMMARY_CACHE_PATH):
+        from sklearn.feature_extraction.text import HashingVectorizer
+
+        self.path = path
+        self.vectorizer = HashingVectorizer(ngram_range=(1, 2), n_features=2 ** 20, alternate_sign=False, norm="l2")
+        self.entries = []
+        self.matrix = None
+        self.stats = {"reused": 0, "updated": 0, "missed": 0}
+        # Entries added by this run, merged into whatever is on disk when saving
+        self.added = []
+        self._lock = threading.Lock()
+
+        if path and os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as file:
+                self.entries = json.load(file)
+            if self.entries:
+                self.matrix = self._vectorise([entry["content"] for entry in self.entries])
+
+    def _vectorise(self, texts):
+        return self.vectorizer.transform([_normalise(text) for text in texts])
+
+    def match(self, content, tier):
+        """
+        Finds the most similar cached story group.
+        Returns (decision, entry, additions) where decision is "reuse", "update" or "miss"
+        and additions holds the sentences the cached story group did not cover.
+        """
+        query = self._vectorise([content])
+        with self._lock:
+            if self.matrix is None:
+                self.stats[DECISION_STATS["miss"]] += 1
+                return "miss", None, ""
+            similarities = (self.matrix @ query.T).toarray().ravel()
+            best = int(similarities.argmax())
+            similarity = float(similarities[best])
+            entry = self.entries[best]
+
+        additions = new_material(entry["content"], content) if similarity >= UPDATE_THRESHOLD else ""
+        if similarity >= REUSE_THRESHOLD and entry["tier"] == tier:
+            decision = "reuse"
+        elif similarity >= UPDATE_THRESHOLD:
+            # Nothing new and the same length tier: the cached summary still fits
+            decision = "update" if additions or entry["tier"] != tier else "reuse"
+        else:
+            decision = "miss"
+
+        with self._lock:
+            self.stats[DECISION_STATS[decision]] += 1
+        return decision, entry, additions
+
+    def add(self, content, tier, headline, summary, source=None):
+        """
+        Stores a freshly generated headline and summary (without the date suffix).
+        """
+        from scipy.sparse import vstack
+
+        entry = {
+            "content": content,
+            "tier": tier,
+            "headline": headline,
+            "summary": summary,
+            "source": source,
+            "created": time.strftime("%Y-%m-%d %H:%M:%S")
+        }
+        vector = self._vectorise([content])
+        with self._lock:
+            self.entries.append(entry)
+            self.added.append(entry)
+            self.matrix = vector if self.matrix is None else vstack([self.matrix, vector]).tocsr()
+            if len(self.entries) > MAX_ENTRIES:
+                # Drop the oldest entries first
+                excess = len(self.entries) - MAX_ENTRIES
+                self.entries = self.entries[excess:]
+                self.matrix = self.matrix[excess:]
+
+    def save(self):
+        """
+        Writes the cache atomically so an interrupted run cannot corrupt it. This run's new entries are
+        appended to the cache as it is on disk now, so runs in other processes (e.g. other countries
+        running in parallel) that saved in the meantime keep theirs.
+        """
+        if not self.path:
+            return
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        temp_path = f"{self.path}.{os.getpid()}.tmp"
+        with self._lock:
+            try:
+                with open(self.path, "r", encoding="utf-8") as file:
+                    entries = json.load(file) + self.added
+            except (OSError, ValueError):
+                entries = self.entries
+            with open(temp_path, "w", encoding="utf-8") as file:
+                json.dump(entries[-MAX_ENTRIES:], file, ensure_ascii=False)
+            os.replace(temp_path, self.path)
+            self.added = []
+
+    def calls_avoided(self):
+        """
+        LLM calls saved: a reuse skips both headline and summary, an update skips the headline
+        and replaces the full summary with a short incremental one.
+        """
+        return self.stats["reused"] * 2 + self.stats["updated"]
+
+    def report(self):
+        """
+        Prints the cache hit counts and records them in the run report.
+        """
+        for key, value in self.stats.items():
+            record_stat("summary_cache", key, value)
+        record_stat("summary_cache", "calls_avoided", self.calls_avoided())
+        print(f"♻️ Summary cache: {self.stats['reused']} reused, {self.stats['updated']} incrementally updated, "
+              f"{self.stats['missed']} new; {self.calls_avoided()} LLM calls avoided")
@@ -0,0 +1,235 @@
+import json
+import threading
+import time
+from dataclasses import dataclass, asdict
+
+# Estimated USD price per 1K tokens as (prompt, completion)
+MODEL_PRICING = {
+    "gpt-4-turbo": (0.01, 0.03),
+    "gpt-4o": (0.0025, 0.01),
+    "gpt-4o-mini": (0.00015, 0.0006),
+}
+
+LATENCY_PERCENTILES = (50, 90, 95, 99)
+
+@dataclass
+class LLMCallRecord:
+    stage: str
+    story_group: object
+    model: str
+    prompt_tokens: int
+    completion_tokens: int
+    latency: float
+    outcome: str
+    started_at: float
+
+_records = []
+_compaction = {}
+_stats = {}
+_records_lock = threading.Lock()
+_run_started = time.time()
+# Optional RateLimiter every completion request waits on (set by set_rate_limiter)
+_rate_limiter = None
+
+def set_rate_limiter(limiter):
+    """
+    Makes every timed_completion call in this process wait on the given RateLimiter (None disables it).
+    """
+    global _rate_limiter
+    _rate_limiter = limiter
+
+def reset_run():
+    """
+    Clears all recorded calls so a new run starts with an empty report.
+    """
+    global _run_started
+    with _records_lock:
+        _records.clear()
+        _compaction.clear()
+        _stats.clear()
+        _run_started = time.time()
+
+def estimate_tokens(text):
+    """
+    Rough token estimate (about four characters per token) for when the API reports no usage.
+    """
+    return max(1, len(text) // 4) if text else 0
+
+def _estimate_prompt_tokens(messages):
+    return sum(estimate_tokens(message.get("content", "")) for message in messages)
+
+def _record(record):
+    with _records_lock:
+        _records.append(record)
+
+def timed_completion(client, stage, story_group=None, **request):
+    """
+    Sends a chat completion request through the given client and records its latency,
+    token usage and outcome under the given stage and story group.
+    With a rate limiter set, the request first waits for quota; the wait is not counted as latency.
+    Exceptions are recorded and re-raised so callers keep their own fallbacks.
+    """
+    model = request.get("model", "unknown")
+    if _rate_limiter is not None:
+        waited = _rate_limiter.acquire(_estimate_prompt_tokens(request.get("messages", [])) + request.get("max_tokens", 0))
+        if waited:
+            with _records_lock:
+                throttling = _stats.setdefault("rate_limit", {"waits": 0, "waited_s": 0.0})
+                throttling["waits"] += 1
+                throttling["waited_s"] = round(throttling["waited_s"] + waited, 3)
+    started_at = time.time()
+    start = time.perf_counter()
+
+    try:
+        response = client.chat.completions.create(**request)
+    except Exception as e:
+        _record(LLMCallRecord(
+            stage=stage,
+            story_group=story_group,
+            model=model,
+            prompt_tokens=_estimate_prompt_tokens(request.get("messages", [])),
+            completion_tokens=0,
+            latency=time.perf_counter() - start,
+            outcome=f"error: {type(e).__name__}",
+            started_at=started_at
+        ))
+        raise
+
+    latency = time.perf_counter() - start
+    usage = getattr(response, "usage", None)
+    prompt_tokens = getattr(usage, "prompt_tokens", None)
+    completion_tokens = getattr(usage, "completion_tokens", None)
+    if prompt_tokens is None:
+        prompt_tokens = _estimate_prompt_tokens(request.get("messages", []))
+    if completion_tokens is None:
+        completion_tokens = estimate_tokens(response.choices[0].message.content or "")
+
+    # A "length" finish reason means the reply hit max_tokens and was cut off
+    finish_reason = getattr(response.choices[0], "finish_reason", None)
+    outcome = "truncated" if finish_reason == "length" else "ok"
+
+    _record(LLMCallRecord(
+        stage=stage,
+        story_group=story_group,
+        model=model,
+        prompt_tokens=int(prompt_tokens),
+        completion_tokens=int(completion_tokens),
+        latency=latency,
+        outcome=outcome,
+        started_at=started_at
+    ))
+    return response
+
+def record_compaction(stage, tokens_before, tokens_after):
+    """
+    Records the estimated prompt tokens of an input before and after compaction.
+    """
+    with _records_lock:
+        totals = _compaction.setdefault(stage, {"inputs": 0, "tokens_before": 0, "tokens_after": 0})
+        totals["inputs"] += 1
+        totals["tokens_before"] += tokens_before
+        totals["tokens_after"] += tokens_after
+
+def record_stat(section, key, value):
+    """
+    Records a named run statistic (cache hits, calls saved, ...) for the run report.
+    """
+    with _records_lock:
+        _stats.setdefault(section, {})[key] = value
+
+def estimate_cost(model, prompt_tokens, completion_tokens):
+    """
+    Estimates the USD cost of a call from MODEL_PRICING. Unknown models cost 0.
+    """
+    prompt_price, completion_price = MODEL_PRICING.get(model, (0.0, 0.0))
+    return prompt_tokens / 1000 * prompt_price + completion_tokens / 1000 * completion_price
+
+def percentile(values, pct):
+    """
+    Linear-interpolated percentile of a list of numbers (0 for an empty list).
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100
+    lower = int(rank)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+def _summarise_calls(records):
+    latencies = [r.latency for r in records]
+    summary = {
+        "calls": len(records),
+        "errors": sum(1 for r in records if r.outcome.startswith("error")),
+        "truncated": sum(1 for r in records if r.outcome == "truncated"),
+        "prompt_tokens": sum(r.prompt_tokens for r in records),
+        "completion_tokens": sum(r.completion_tokens for r in records),
+        "total_latency_s": round(sum(latencies), 3),
+        "latency_s": {f"p{p}": round(percentile(latencies, p), 3) for p in LATENCY_PERCENTILES},
+        "estimated_cost_usd": round(sum(estimate_cost(r.model, r.prompt_tokens, r.completion_tokens) for r in records), 4)
+    }
+    summary["latency_s"]["max"] = round(max(latencies), 3) if latencies else 0.0
+    return summary
+
+def build_run_report():
+    """
+    Builds the run report: overall and per-stage latency percentiles, token totals,
+    estimated cost, and the individual call records.
+    """
+    with _records_lock:
+        records = list(_records)
+        compaction = {stage: dict(totals) for stage, totals in _compaction.items()}
+        stats = {section: dict(values) for section, values in _stats.items()}
+        run_started = _run_started
+
+    for totals in compaction.values():
+        before = totals["tokens_before"]
+        totals["saved_pct"] = round((1 - totals["tokens_after"] / before) * 100, 1) if before else 0.0
+
+    stages = {}
+    for record in records:
+        stages.setdefault(record.stage, []).append(record)
+
+    return {
+        "run_started": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(run_started)),
+        "wall_time_s": round(time.time() - run_started, 3),
+        "overall": _summarise_calls(records),
+        "stages": {stage: _summarise_calls(stage_records) for stage, stage_records in stages.items()},
+        "prompt_compaction": compaction,
+        "stats": stats,
+        "calls": [asdict(record) for record in records]
+    }
+
+def write_run_report(output_json, report=None):
+    """
+    Writes the run report to a JSON file and returns it.
+    """
+    report = report if report is not None else build_run_report()
+    with open(output_json, "w", encoding="utf-8") as file:
+        json.dump(report, file, indent=2, ensure_ascii=False, default=str)
+    return report
+
+def format_run_summary(report):
+    """
+    Formats the run report as a short plain-text table for the terminal pane.
+    """
+    overall = report["overall"]
+    lines = [
+        f"📊 LLM run report: {overall['calls']} calls, {overall['errors']} errors, "
+        f"{overall['prompt_tokens'] + overall['completion_tokens']} tokens, "
+        f"~${overall['estimated_cost_usd']:.2f}, wall time {report['wall_time_s']:.1f}s"
+    ]
+    for stage, stats in report["stages"].items():
+        latency = stats["latency_s"]
+        lines.append(
+            f"   {stage}: {stats['calls']} calls | p50 {latency['p50']:.2f}s p95 {latency['p95']:.2f}s max {latency['max']:.2f}s | "
+            f"{stats['prompt_tokens']} prompt + {stats['completion_tokens']} completion tokens | ~${stats['estimated_cost_usd']:.2f}"
+        )
+    for stage, totals in report.get("prompt_compaction", {}).items():
+        lines.append(
+            f"   {stage} input compaction: {totals['tokens_before']} → {totals['tokens_after']} tokens "
+            f"({totals['saved_pct']:.0f}% saved over {totals['inputs']} inputs)"
+        )
+    for section, values in report.get("stats", {}).items():
+        lines.append(f"   {section}: " + ", ".join(f"{key} {value}" for key, value in values.items()))
+    return "\n".join(lines)
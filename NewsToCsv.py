@@ -3,6 +3,8 @@ import re
 import csv
 import pandas as pd
 from datetime import datetime
+from NewsCancellation import checkpoint
+from NewsProgress import ProgressTracker
 
 def read_markdown_file(md_path):
     """
@@ -66,8 +68,10 @@ def process_markdown_files(file_paths):
     Ensures that extracted headlines and content are strings to prevent later errors.
     """
     all_articles = []
+    progress = ProgressTracker("extract", len(file_paths), "files")
 
     for file_path in file_paths:
+        checkpoint()
         if file_path.endswith(".md"):
             print(f"🔍 Processing file: {os.path.basename(file_path)}")
 
@@ -82,6 +86,9 @@ def process_markdown_files(file_paths):
                 content = str(content) if isinstance(content, str) else ""
 
                 all_articles.append([date, headline, content])
+        progress.advance()
+
+    progress.finish()
 
     # Sort articles chronologically based on the date
     all_articles.sort(key=lambda x: datetime.strptime(x[0], "%d %B %Y") if x[0] != "Unknown Date" else datetime.min)
@@ -1,39 +1,66 @@
 from docx import Document
 from docx.shared import Pt, Cm, RGBColor
+from docx.enum.style import WD_STYLE_TYPE
 from docx.enum.text import WD_PARAGRAPH_ALIGNMENT
 from docx.oxml import OxmlElement
 from docx.oxml.ns import qn
 import os
 import re
+from NewsCountryProfiles import resolve_profile
+
+FONT_NAME = "Proxima Nova"
+HEADING_COLOUR = RGBColor(23, 84, 128)  # Hex #175480
+BODY_COLOUR = RGBColor(53, 55, 68)  # Hex #353744
+
+# Optional Word template holding the named digest styles (e.g. restyled in Word);
+# when it does not exist the styles are built in code by build_digest_template
+DOCX_TEMPLATE_PATH = os.getenv("NEWS_DOCX_TEMPLATE", "digest_template.docx")
+
+# Digests at least this large are streamed straight into the .docx (see NewsDocxStream)
+STREAMING_THRESHOLD_BYTES = int(os.getenv("NEWS_DOCX_STREAMING_BYTES", 5 * 2 ** 20))
+
+# Named styles used by the styled renderer
+BODY_STYLE = "Digest Body"
+TITLE_STYLE = "Digest Title"
+TOC_TITLE_STYLE = "Digest TOC Title"
+STRONG_STYLE = "Digest Strong"
+HEADING_STYLES = {1: "Heading 1", 2: "Heading 2", 3: "Heading 3"}  # By Markdown heading level
+
+BOLD_PATTERN = r"\*\*(.*?)\*\*"  # Match text inside **double asterisks**
 
 def format_markdown_bold(paragraph, text):
     """Detects Markdown bold (**bold**) and applies Word bold formatting."""
-    pattern = r"\*\*(.*?)\*\*"  # Match text inside **double asterisks**
-    matches = re.split(pattern, text)  # Split normal text and bold parts
-    
+    matches = re.split(BOLD_PATTERN, text)  # Split normal text and bold parts
+
     for i, part in enumerate(matches):
         run = paragraph.add_run(part)
         if i % 2 == 1:  # Every second part (inside ** **) should be bold
             run.bold = True
-            
+
      # Apply consistent font styling to all text
-        run.font.name = "Proxima Nova"
+        run.font.name = FONT_NAME
         run.font.size = Pt(11)
-        run.font.color.rgb = RGBColor(53, 55, 68)  # Hex #353744
-
-def add_auto_generated_toc(doc):
-    toc_paragraph = doc.add_paragraph()
-    run = toc_paragraph.add_run("Table of Contents")
-    run.bold = True
-    run.font.size = Pt(14)
-    run.font.name = "Proxima Nova"
-    run.font.color.rgb = RGBColor(23, 84, 128)  # Hex #175480
-    toc_paragraph.alignment = WD_PARAGRAPH_ALIGNMENT.CENTER
-    
-    doc.add_paragraph()  # Space below TOC
-    
-    # Insert Word's auto-generated TOC field
-    toc = doc.add_paragraph()
+        run.font.color.rgb = BODY_COLOUR
+
+def add_styled_paragraph(doc, style_id, text=None):
+    """
+    Adds a paragraph that references a style by id. Setting pStyle directly avoids python-docx's
+    per-call style resolution, which scans every style in the document.
+    """
+    paragraph = doc.add_paragraph(text)
+    paragraph._p.style = style_id
+    return paragraph
+
+def add_styled_markdown_runs(paragraph, text, strong_style_id):
+    """Adds Markdown text as runs that only reference styles: bold parts use the strong character style."""
+    for i, part in enumerate(re.split(BOLD_PATTERN, text)):
+        if part:
+            run = paragraph.add_run(part)
+            if i % 2 == 1:
+                run._r.style = strong_style_id
+
+def add_toc_field(paragraph):
+    """Appends Word's auto-generated TOC field (updated when the document is opened in Word)."""
     fldChar1 = OxmlElement('w:fldChar')
     fldChar1.set(qn('w:fldCharType'), 'begin')
     instrText = OxmlElement('w:instrText')
@@ -42,76 +69,213 @@ def add_auto_generated_toc(doc):
     fldChar2.set(qn('w:fldCharType'), 'separate')
     fldChar3 = OxmlElement('w:fldChar')
     fldChar3.set(qn('w:fldCharType'), 'end')
-    
-    toc._element.append(fldChar1)
-    toc._element.append(instrText)
-    toc._element.append(fldChar2)
-    toc._element.append(fldChar3)
-    
+
+    paragraph._element.append(fldChar1)
+    paragraph._element.append(instrText)
+    paragraph._element.append(fldChar2)
+    paragraph._element.append(fldChar3)
+
+def add_auto_generated_toc(doc, title_style_id=None):
+    if title_style_id is not None:
+        add_styled_paragraph(doc, title_style_id, "Table of Contents")
+    else:
+        toc_paragraph = doc.add_paragraph()
+        run = toc_paragraph.add_run("Table of Contents")
+        run.bold = True
+        run.font.size = Pt(14)
+        run.font.name = FONT_NAME
+        run.font.color.rgb = HEADING_COLOUR
+        toc_paragraph.alignment = WD_PARAGRAPH_ALIGNMENT.CENTER
+
+    doc.add_paragraph()  # Space below TOC
+
+    # Insert Word's auto-generated TOC field
+    add_toc_field(doc.add_paragraph())
+
     doc.add_paragraph("\n")  # Space after TOC
 
-def convert_markdown_to_word(input_md, output_docx, logo_path):
+def _set_style_font(style, size=None, colour=None, bold=None):
+    """Sets the digest font on a style, dropping theme fonts that would otherwise take precedence."""
+    style.font.name = FONT_NAME
+    rFonts = style.element.rPr.find(qn("w:rFonts"))
+    for attribute in ("w:asciiTheme", "w:hAnsiTheme", "w:eastAsiaTheme", "w:cstheme"):
+        rFonts.attrib.pop(qn(attribute), None)
+    if size is not None:
+        style.font.size = Pt(size)
+    if colour is not None:
+        style.font.color.rgb = colour
+    if bold is not None:
+        style.font.bold = bold
+
+def build_digest_template():
+    """
+    Returns an empty Document whose named styles carry all digest formatting
+    (Proxima Nova body, heading colours, title, bold), so rendered paragraphs and runs only reference styles.
+    """
     doc = Document()
-    
-    # Add front page with centered logo
+    styles = doc.styles
+
+    body = styles.add_style(BODY_STYLE, WD_STYLE_TYPE.PARAGRAPH)
+    body.base_style = styles["Normal"]
+    body.paragraph_format.alignment = WD_PARAGRAPH_ALIGNMENT.JUSTIFY
+    _set_style_font(body, size=11, colour=BODY_COLOUR)
+
+    title = styles.add_style(TITLE_STYLE, WD_STYLE_TYPE.PARAGRAPH)
+    title.base_style = styles["Normal"]
+    title.paragraph_format.alignment = WD_PARAGRAPH_ALIGNMENT.CENTER
+    _set_style_font(title, size=24, colour=HEADING_COLOUR, bold=True)
+
+    toc_title = styles.add_style(TOC_TITLE_STYLE, WD_STYLE_TYPE.PARAGRAPH)
+    toc_title.base_style = styles["Normal"]
+    toc_title.paragraph_format.alignment = WD_PARAGRAPH_ALIGNMENT.CENTER
+    _set_style_font(toc_title, size=14, colour=HEADING_COLOUR, bold=True)
+
+    strong = styles.add_style(STRONG_STYLE, WD_STYLE_TYPE.CHARACTER)
+    strong.font.bold = True
+
+    for style_name in HEADING_STYLES.values():
+        _set_style_font(styles[style_name], colour=HEADING_COLOUR)
+    _set_style_font(styles["Heading 2"], size=14)
+    return doc
+
+def load_digest_template(template_path=DOCX_TEMPLATE_PATH):
+    """Opens the Word template if there is one, otherwise builds the digest styles in code."""
+    if template_path and os.path.exists(template_path):
+        return Document(template_path)
+    return build_digest_template()
+
+def add_front_page(doc, logo_path):
+    """Adds the centered logo that opens the digest."""
     logo_paragraph = doc.add_paragraph()
     logo_paragraph.alignment = WD_PARAGRAPH_ALIGNMENT.CENTER
     run = logo_paragraph.add_run()
     run.add_picture(logo_path, width=Cm(14.67), height=Cm(7.32))
-    
+
+def digest_style_ids(doc):
+    """Maps the digest style names to their style ids (resolved once; python-docx looks styles up with a linear search)."""
+    return {name: doc.styles[name].style_id
+            for name in (BODY_STYLE, TITLE_STYLE, TOC_TITLE_STYLE, STRONG_STYLE, *HEADING_STYLES.values())}
+
+def markdown_blocks(lines):
+    """
+    Yields (level, text) blocks from Markdown digest lines: level 1-3 for "#" to "###" headings
+    and 0 for body paragraphs; blank lines are skipped.
+    """
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        marker = line[:line.find(" ") + 1] if line.startswith("#") else ""
+        level = len(marker) - 1
+        if marker == "#" * level + " " and level in HEADING_STYLES:
+            yield level, line[len(marker):]
+        else:
+            yield 0, line
+
+def render_styled(blocks, logo_path, profile, template_path=DOCX_TEMPLATE_PATH):
+    """Renders (level, text) blocks into a Document where every paragraph and run references a named style."""
+    doc = load_digest_template(template_path)
+    style_ids = digest_style_ids(doc)
+
+    add_front_page(doc, logo_path)
+    add_styled_paragraph(doc, style_ids[TITLE_STYLE], profile.docx_title)
+    add_auto_generated_toc(doc, style_ids[TOC_TITLE_STYLE])
+    doc.add_page_break()
+
+    for level, text in blocks:
+        if level:
+            add_styled_paragraph(doc, style_ids[HEADING_STYLES[level]], text)
+        else:
+            add_styled_markdown_runs(add_styled_paragraph(doc, style_ids[BODY_STYLE]), text, style_ids[STRONG_STYLE])
+    return doc
+
+def render_direct(lines, logo_path, profile):
+    """Renders digest Markdown lines with font, size and colour set directly on every run."""
+    doc = Document()
+
+    # Add front page with centered logo
+    add_front_page(doc, logo_path)
+
     title = doc.add_paragraph()
-    title_run = title.add_run("Mundus Prime\nMonthly News Digest")
+    title_run = title.add_run(profile.docx_title)
     title_run.bold = True
     title_run.font.size = Pt(24)
-    title_run.font.name = "Proxima Nova"
-    title_run.font.color.rgb = RGBColor(23, 84, 128)  # Hex #175480
+    title_run.font.name = FONT_NAME
+    title_run.font.color.rgb = HEADING_COLOUR
     title.alignment = WD_PARAGRAPH_ALIGNMENT.CENTER
-    
+
     # Add auto-generated Table of Contents **immediately after title**
     add_auto_generated_toc(doc)
-    
+
     doc.add_page_break()
-    
-    # Read markdown content
-    with open(input_md, "r", encoding="utf-8") as file:
-        lines = file.readlines()
-    
+
     # Process content and structure it in Word
     for line in lines:
         line = line.strip()
-        
+
         if line.startswith("# "):
             heading = doc.add_paragraph(line[2:], style="Heading 1")
             heading.alignment = WD_PARAGRAPH_ALIGNMENT.LEFT
             run = heading.runs[0]
-            run.font.name = "Proxima Nova"
-            run.font.color.rgb = RGBColor(23, 84, 128)  # Hex #175480
+            run.font.name = FONT_NAME
+            run.font.color.rgb = HEADING_COLOUR
         elif line.startswith("## "):
             heading = doc.add_paragraph(line[3:], style="Heading 2")
             heading.alignment = WD_PARAGRAPH_ALIGNMENT.LEFT
             run = heading.runs[0]
             run.font.size = Pt(14)
-            run.font.name = "Proxima Nova"
-            run.font.color.rgb = RGBColor(23, 84, 128)  # Hex #175480
+            run.font.name = FONT_NAME
+            run.font.color.rgb = HEADING_COLOUR
         elif line.startswith("### "):
             heading = doc.add_paragraph(line[4:], style="Heading 3")
             heading.alignment = WD_PARAGRAPH_ALIGNMENT.LEFT
             run = heading.runs[0]
-            run.font.name = "Proxima Nova"
-            run.font.color.rgb = RGBColor(23, 84, 128)  # Hex #175480
+            run.font.name = FONT_NAME
+            run.font.color.rgb = HEADING_COLOUR
         elif line:
+            # format_markdown_bold already applies the body font to every run
             paragraph = doc.add_paragraph()
             format_markdown_bold(paragraph, line)
             paragraph.alignment = WD_PARAGRAPH_ALIGNMENT.JUSTIFY
-            run = paragraph.runs[0]
-            run.font.size = Pt(11)
-            run.font.name = "Proxima Nova"
-            run.font.color.rgb = RGBColor(53, 55, 68)  # Hex #353744
-    
+    return doc
+
+def convert_markdown_to_word(input_md, output_docx, logo_path, profile=None, styled=True, template_path=DOCX_TEMPLATE_PATH):
+    """
+    Converts the Markdown digest to Word. By default paragraphs and runs reference the named digest styles
+    (see build_digest_template); styled=False sets the formatting directly on every run as before.
+    Styled digests of STREAMING_THRESHOLD_BYTES or more are written by the streaming OOXML writer.
+    """
+    profile = resolve_profile(profile)
+    if styled and os.path.getsize(input_md) >= STREAMING_THRESHOLD_BYTES:
+        from NewsDocxStream import stream_markdown_to_word
+        stream_markdown_to_word(input_md, output_docx, logo_path, profile, template_path)
+        return
+
+    # Read markdown content
+    with open(input_md, "r", encoding="utf-8") as file:
+        lines = file.readlines()
+
+    if styled:
+        doc = render_styled(markdown_blocks(lines), logo_path, profile, template_path)
+    else:
+        doc = render_direct(lines, logo_path, profile)
+
     # Save to Word document
     doc.save(output_docx)
     print(f"✅ Converted {input_md} to {output_docx}")
 
+def write_blocks_to_word(blocks, output_docx, logo_path, profile=None, template_path=DOCX_TEMPLATE_PATH, streaming=False):
+    """
+    Writes (level, text) blocks, e.g. from a DigestDocument, to a styled .docx without any Markdown
+    round trip; streaming=True uses the streaming OOXML writer.
+    """
+    profile = resolve_profile(profile)
+    if streaming:
+        from NewsDocxStream import stream_blocks_to_word
+        stream_blocks_to_word(blocks, output_docx, logo_path, profile, template_path)
+    else:
+        render_styled(blocks, logo_path, profile, template_path).save(output_docx)
+
 def main():
     """
     Main function that runs when the script is executed directly.
@@ -120,7 +284,7 @@ def main():
     input_md = "Monthly_News_Digest.md"
     output_docx = "Monthly_News_Digest.docx"
     logo_path = "Mundus_Icon.png"
-    
+
     convert_markdown_to_word(input_md, output_docx, logo_path)
 
 if __name__ == "__main__":
@@ -0,0 +1,130 @@
+import json
+import os
+import sys
+import time
+from collections import Counter
+from datetime import datetime
+import pandas as pd
+
+LABEL_STORE_COLUMNS = ["Summary", "Category", "Source", "Added"]
+
+def metrics_path_for(store_path):
+    """
+    Returns the escalation metrics file kept next to a label store.
+    """
+    return f"{os.path.splitext(store_path)[0]}_metrics.json"
+
+def load_store(store_path):
+    """
+    Loads the managed label store, or an empty frame if it does not exist yet.
+    """
+    if not store_path or not os.path.exists(store_path):
+        return pd.DataFrame(columns=LABEL_STORE_COLUMNS)
+    return pd.read_csv(store_path)
+
+def append_labels(store_path, summaries, labels, source):
+    """
+    Appends labelled summaries to the store. A summary that is already stored keeps only its
+    newest label, so later corrections (e.g. human edits) override earlier LLM decisions.
+    Returns (the rows added for summaries not yet in the store, the number of stored summaries
+    whose label changed); summaries stored with the same label are left as they are.
+    """
+    new_rows = pd.DataFrame({
+        "Summary": [str(summary) for summary in summaries],
+        "Category": [str(label) for label in labels],
+        "Source": source,
+        "Added": time.strftime("%Y-%m-%d %H:%M:%S")
+    })
+    # Within one batch the last label of a repeated summary wins
+    new_rows = new_rows.drop_duplicates(subset="Summary", keep="last")
+    store = load_store(store_path)
+    stored_labels = new_rows["Summary"].map(dict(zip(store["Summary"].astype(str), store["Category"].astype(str))))
+    added = new_rows[stored_labels.isna()].reset_index(drop=True)
+    changed = stored_labels.notna() & (stored_labels != new_rows["Category"])
+    relabelled = int(changed.sum())
+    if added.empty and not relabelled:
+        return added, 0
+
+    store = pd.concat([store, new_rows[stored_labels.isna() | changed]], ignore_index=True)
+    store = store.drop_duplicates(subset="Summary", keep="last")
+
+    os.makedirs(os.path.dirname(store_path) or ".", exist_ok=True)
+    temp_path = f"{store_path}.tmp"
+    store.to_csv(temp_path, index=False, encoding="utf-8")
+    os.replace(temp_path, store_path)
+    return added, relabelled
+
+def import_human_edits(store_path, reviewed_file):
+    """
+    Adds human-reviewed categories from a spreadsheet with 'Summary' and 'Category'
+    (or 'Refined Category') columns to the store.
+    """
+    df = pd.read_csv(reviewed_file) if reviewed_file.endswith(".csv") else pd.read_excel(reviewed_file)
+    label_column = "Category" if "Category" in df.columns else "Refined Category"
+    if "Summary" not in df.columns or label_column not in df.columns:
+        raise ValueError("Reviewed file must include 'Summary' and 'Category' columns.")
+    df = df.dropna(subset=["Summary", label_column])
+    added, relabelled = append_labels(store_path, df["Summary"], df[label_column], "human")
+    return len(added) + relabelled
+
+def digest_month(dates):
+    """
+    Returns the month ("2025-02") most of the given article dates ("13 February 2025") fall in,
+    or None if none of them can be parsed.
+    """
+    months = Counter()
+    for date in dates:
+        try:
+            months[datetime.strptime(str(date).strip(), "%d %B %Y").strftime("%Y-%m")] += 1
+        except ValueError:
+            continue
+    return months.most_common(1)[0][0] if months else None
+
+def record_escalation_share(metrics_path, total, escalated, month, label=None):
+    """
+    Records the LLM escalation share of the digest for month ("2025-02") in the metrics history and
+    returns the history in month order, so the share can be followed month over month as the classifier
+    learns. Re-running or back-filling a month replaces its earlier entry.
+    """
+    history = []
+    if os.path.exists(metrics_path):
+        with open(metrics_path, "r", encoding="utf-8") as file:
+            history = json.load(file)
+
+    history = [entry for entry in history if entry.get("month") != month]
+    history.append({
+        "run": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "month": month,
+        "label": label,
+        "stories": total,
+        "escalated": escalated,
+        "share": round(escalated / total, 4) if total else 0.0
+    })
+    history.sort(key=lambda entry: str(entry.get("month")))
+
+    os.makedirs(os.path.dirname(metrics_path) or ".", exist_ok=True)
+    temp_path = f"{metrics_path}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as file:
+        json.dump(history, file, indent=2)
+    os.replace(temp_path, metrics_path)
+    return history
+
+def format_escalation_trend(history, last=6):
+    """
+    Formats the most recent escalation shares as a one-line trend.
+    """
+    return " → ".join(f"{entry['month']}: {entry['share']:.0%}" for entry in history[-last:])
+
+def main():
+    """
+    Imports human category edits into a label store:
+    python NewsTrainingStore.py reviewed_digest.xlsx label_store/LabelStore_sweden.csv
+    """
+    if len(sys.argv) != 3:
+        print(main.__doc__)
+        sys.exit(2)
+    added = import_human_edits(sys.argv[2], sys.argv[1])
+    print(f"✅ Added {added} human-reviewed labels to {sys.argv[2]}")
+
+if __name__ == "__main__":
+    main()
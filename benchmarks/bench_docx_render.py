@@ -0,0 +1,88 @@
+"""
+Benchmarks Word rendering of a synthetic digest: direct per-run formatting, style-based rendering
+and the streaming OOXML writer (render time, .docx size, uncompressed document.xml size and,
+in a second traced pass, peak Python memory).
+
+Usage: python benchmarks/bench_docx_render.py [--stories 2000]
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+import zipfile
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, ROOT)
+
+from NewsCountryProfiles import load_profile
+from NewsDocxStream import stream_markdown_to_word
+import NewsToDocx
+from NewsToDocx import convert_markdown_to_word
+
+WORDS = ("government minister agreement energy defence budget election market company climate police "
+         "university research investment inflation parliament report sector growth security").split()
+
+def write_digest(path, stories, seed=0):
+    """
+    Writes a Markdown digest with the profile's categories and stories of 2-5 sentences,
+    some with **bold** phrases, spread evenly over the categories.
+    """
+    rng = random.Random(seed)
+    categories = load_profile().category_order
+    with open(path, "w", encoding="utf-8") as file:
+        file.write("# News\n\n")
+        for index, category in enumerate(categories):
+            file.write(f"## {category}\n\n")
+            for _ in range(stories // len(categories) + (index < stories % len(categories))):
+                sentences = [" ".join(rng.choices(WORDS, k=rng.randint(12, 25))).capitalize() + "."
+                             for _ in range(rng.randint(2, 5))]
+                if rng.random() < 0.3:
+                    sentences[0] = f"**{sentences[0]}**"
+                file.write(" ".join(sentences) + f" ({rng.randint(1, 28)} May)\n\n")
+
+def render(mode, input_md, output_docx):
+    logo_path = os.path.join(ROOT, "Mundus_Icon.png")
+    if mode == "streaming":
+        stream_markdown_to_word(input_md, output_docx, logo_path)
+    else:
+        convert_markdown_to_word(input_md, output_docx, logo_path, styled=mode == "styled")
+
+def measure(mode, input_md, output_docx):
+    start = time.perf_counter()
+    render(mode, input_md, output_docx)
+    elapsed = time.perf_counter() - start
+    with zipfile.ZipFile(output_docx) as archive:
+        xml_size = archive.getinfo("word/document.xml").file_size / 1024
+
+    tracemalloc.start()
+    render(mode, input_md, output_docx)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, os.path.getsize(output_docx) / 1024, xml_size, peak / 2 ** 20
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--stories", type=int, default=2000)
+    args = parser.parse_args()
+
+    # Never hand off to the streaming writer, so "styled" always measures the python-docx renderer
+    NewsToDocx.STREAMING_THRESHOLD_BYTES = float("inf")
+    results = {}
+    with tempfile.TemporaryDirectory() as work_dir:
+        input_md = os.path.join(work_dir, "digest.md")
+        write_digest(input_md, args.stories)
+        for mode in ("direct", "styled", "streaming"):
+            results[mode] = measure(mode, input_md, os.path.join(work_dir, f"{mode}.docx"))
+
+    print(f"Stories: {args.stories}")
+    for mode, (elapsed, size, xml_size, peak) in results.items():
+        print(f"{mode:<10} {elapsed:6.2f}s  {size:7.0f} KiB .docx  {xml_size:7.0f} KiB document.xml  peak {peak:6.1f} MiB")
+    print(f"Styled speedup over direct:    {results['direct'][0] / results['styled'][0]:.1f}x")
+    print(f"Streaming speedup over direct: {results['direct'][0] / results['streaming'][0]:.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Benchmarks cold-start import time of the entry points and pipeline modules, each in a fresh interpreter
+started with `python -X importtime`, without an OpenAI API key in the environment. Reports every module's
+cumulative import time and the slowest imports it pulls in, and, when a display is available, the time
+until the GUI window has been drawn.
+
+Usage: python benchmarks/bench_import_time.py [--top 8] [--budget 1.0]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+ENTRY_POINTS = ["NewsProcessorGUI", "NewsProcessorCLI", "NewsParallel", "NewsPipeline"]
+STAGE_MODULES = ["NewsToCsv", "NewsChainer", "NewsMerger", "NewsSummariser", "NewsDigestor", "NewsDocumentModel", "NewsToDocx"]
+
+# Creates the app and draws the window once
+WINDOW_SCRIPT = """
+import tkinter as tk
+from NewsProcessorGUI import NewsProcessorApp
+root = tk.Tk()
+NewsProcessorApp(root)
+root.update()
+root.destroy()
+"""
+
+def clean_environment():
+    """
+    Environment of a first start on a fresh machine: no API key and no .env file in the working directory.
+    """
+    env = {key: value for key, value in os.environ.items() if key != "OPENAI_API_KEY"}
+    env["PYTHONPATH"] = ROOT
+    env.pop("PYTHONSTARTUP", None)
+    return env
+
+def parse_importtime(stderr):
+    """
+    Parses `-X importtime` output into (module, self µs, cumulative µs, depth) tuples, in import order.
+    """
+    imports = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip())) // 2
+        imports.append((name.strip(), int(self_us), int(cumulative_us), depth))
+    return imports
+
+def profile_import(module, cwd):
+    """
+    Imports module in a fresh interpreter; returns (wall seconds, parsed imports, error output or None).
+    """
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                            cwd=cwd, env=clean_environment(), capture_output=True, text=True)
+    wall = time.perf_counter() - start
+    imports = parse_importtime(result.stderr)
+    error = None
+    if result.returncode:
+        error = [line for line in result.stderr.splitlines() if not line.startswith("import time:")][-1]
+    return wall, imports, error
+
+def time_window(cwd):
+    """
+    Seconds from process start until the GUI window is drawn, or None without a display.
+    """
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, "-c", WINDOW_SCRIPT], cwd=cwd, env=clean_environment(),
+                            capture_output=True, text=True)
+    if result.returncode:
+        return None
+    return time.perf_counter() - start
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--top", type=int, default=8, help="Slowest imports listed per module")
+    parser.add_argument("--budget", type=float, default=1.0,
+                        help="Seconds the GUI may take to import (and draw its window); exit code 1 when over")
+    args = parser.parse_args()
+
+    over_budget = False
+    with tempfile.TemporaryDirectory() as cwd:
+        for module in ENTRY_POINTS + STAGE_MODULES:
+            wall, imports, error = profile_import(module, cwd)
+            own = next((imp for imp in reversed(imports) if imp[0] == module and imp[3] == 0), None)
+            cumulative = own[2] / 1e6 if own else float("nan")
+            print(f"\n{module}: {cumulative:.3f}s cumulative import, {wall:.3f}s process wall time")
+            if error:
+                print(f"  ❌ Import failed: {error}")
+            # Modules imported directly by this one, slowest first
+            slowest = sorted((imp for imp in imports if imp[3] == 1), key=lambda imp: imp[2], reverse=True)[:args.top]
+            for name, self_us, cumulative_us, depth in slowest:
+                print(f"  {cumulative_us / 1000:9.1f} ms  {name}")
+            if module == "NewsProcessorGUI" and (error or cumulative > args.budget):
+                over_budget = True
+
+        window = time_window(cwd)
+    if window is None:
+        print("\nGUI window: no display available, not measured")
+    else:
+        print(f"\nGUI window drawn after {window:.3f}s (budget {args.budget:.1f}s)")
+        over_budget = over_budget or window > args.budget
+    if over_budget:
+        print("❌ GUI start-up is over budget")
+    return 1 if over_budget else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
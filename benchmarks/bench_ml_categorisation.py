@@ -0,0 +1,59 @@
+"""
+Benchmarks per-row categorize_story_ml against batched categorize_stories_ml on a synthetic month
+of summaries, and checks that both give identical labels.
+
+Usage: python benchmarks/bench_ml_categorisation.py [--summaries 5000]
+"""
+
+import argparse
+import glob
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, ROOT)
+os.environ.setdefault("OPENAI_API_KEY", "benchmark-stub-key")
+
+import pandas as pd
+import NewsDigestor
+
+def make_summaries(training_df, count, seed=0):
+    """
+    Builds synthetic summaries by recombining sentences from the training data.
+    """
+    rng = random.Random(seed)
+    sentences = [s.strip() + "." for text in training_df["Summary"].astype(str) for s in text.split(".") if s.strip()]
+    return pd.Series([" ".join(rng.sample(sentences, rng.randint(1, 4))) + f" (1{rng.randint(0, 9)} May)"
+                      for _ in range(count)])
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--summaries", type=int, default=5000)
+    args = parser.parse_args()
+
+    training_files = glob.glob(os.path.join(ROOT, "TrainingData*.xlsx"))
+    classifier = NewsDigestor.train_classifier(training_files)
+    training_df = pd.concat([pd.read_excel(file) for file in training_files], ignore_index=True)
+    summaries = make_summaries(training_df, args.summaries)
+
+    start = time.perf_counter()
+    per_row = summaries.apply(lambda x: NewsDigestor.categorize_story_ml(classifier, x))
+    per_row_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batched, _ = NewsDigestor.categorize_stories_ml(classifier, summaries)
+    batched_time = time.perf_counter() - start
+
+    mismatches = int((per_row.to_numpy() != batched).sum())
+    print(f"Summaries: {len(summaries)}")
+    print(f"Per-row apply:  {per_row_time:.3f}s")
+    print(f"Batched:        {batched_time:.3f}s")
+    print(f"Speedup:        {per_row_time / batched_time:.1f}x")
+    print(f"Label mismatches: {mismatches}")
+    if mismatches:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
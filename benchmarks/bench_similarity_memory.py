@@ -0,0 +1,62 @@
+"""
+Benchmarks the dense N×N similarity refinement against the sparse per-category aggregates
+(SIMILARITY_MODE = "sparse"): time and peak traced memory, and checks both refine identically.
+
+Usage: python benchmarks/bench_similarity_memory.py [--summaries 8000]
+"""
+
+import argparse
+import glob
+import os
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+os.environ.setdefault("OPENAI_API_KEY", "benchmark-stub-key")
+
+import numpy as np
+import pandas as pd
+import NewsDigestor
+from NewsCountryProfiles import load_profile
+from NewsFeatures import DigestFeatures
+from bench_ml_categorisation import make_summaries
+
+def measure(refine):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = refine()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak / 2 ** 20
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--summaries", type=int, default=8000)
+    args = parser.parse_args()
+
+    training_files = glob.glob(os.path.join(ROOT, "TrainingData*.xlsx"))
+    training_df = pd.concat([pd.read_excel(file) for file in training_files], ignore_index=True)
+    summaries = make_summaries(training_df, args.summaries)
+    classifier = NewsDigestor.train_classifier(training_files)
+    category_names = list(load_profile().categories.keys())
+
+    features = DigestFeatures(NewsDigestor.preprocess_series(summaries), NewsDigestor.CLASSIFIER_PARAMS["ngram_range"])
+    assigned, _ = NewsDigestor.categorize_stories_ml(classifier, summaries, features)
+    features.tfidf()
+
+    (dense, _), dense_time, dense_peak = measure(lambda: NewsDigestor.refine_categories(
+        features.similarity(), assigned, category_names))
+    (sparse, _), sparse_time, sparse_peak = measure(lambda: NewsDigestor.refine_categories(
+        None, assigned, category_names, features.category_mean_similarity(assigned, category_names)))
+
+    print(f"Summaries: {len(summaries)}")
+    print(f"Dense N×N:      {dense_time:.3f}s, peak {dense_peak:.1f} MiB")
+    print(f"Sparse C-means: {sparse_time:.3f}s, peak {sparse_peak:.1f} MiB")
+    print(f"Refinement mismatches: {int(np.sum(dense != sparse))}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Benchmarks input-order vs longest-first scheduling of summarisation jobs against the stub LLM.
+
+Usage: python benchmarks/bench_summary_scheduling.py [--groups 30] [--workers 4]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+os.environ.setdefault("OPENAI_API_KEY", "benchmark-stub-key")
+
+import pandas as pd
+import NewsSummariser
+from NewsScheduler import estimate_job_cost, run_longest_first
+from stub_llm import StubClient
+
+def make_story_groups(num_groups):
+    """
+    Builds merged story groups in a realistic worst-case order: mostly one-liners,
+    with the few large multi-article chains arriving at the end.
+    """
+    rows = []
+    for group_id in range(1, num_groups + 1):
+        num_articles = 15 if group_id > num_groups - max(1, num_groups // 10) else 1 + group_id % 3
+        # Distinct sentences so prompt compaction does not collapse the articles
+        articles = [f"({day} May 2025) Headline {group_id}.{day}:\n"
+                    + " ".join(f"Officials in group {group_id} gave update {day}.{n} on energy prices and defence spending."
+                               for n in range(6 + day % 5))
+                    for day in range(1, num_articles + 1)]
+        rows.append({
+            "Story Group ID": group_id,
+            "Dates": ", ".join(f"{day} May 2025" for day in range(1, num_articles + 1)),
+            "Headlines": " | ".join(f"Headline {group_id}.{day}" for day in range(1, num_articles + 1)),
+            "Merged Content": "\n\n".join(articles)
+        })
+    return [row for _, row in pd.DataFrame(rows).iterrows()]
+
+def time_schedule(rows, costs, workers):
+    start = time.perf_counter()
+    results = run_longest_first(rows, NewsSummariser.summarise_story_group, costs, max_workers=workers)
+    return time.perf_counter() - start, results
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--groups", type=int, default=30)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    NewsSummariser.client = StubClient()
+    rows = make_story_groups(args.groups)
+
+    # Silence per-story progress output while timing
+    real_stdout = sys.stdout
+    sys.stdout = open(os.devnull, "w", encoding="utf-8")
+    try:
+        input_order_time, input_order_results = time_schedule(rows, [0] * len(rows), args.workers)
+        costs = [estimate_job_cost(row["Merged Content"], row["Dates"]) for row in rows]
+        longest_first_time, longest_first_results = time_schedule(rows, costs, args.workers)
+    finally:
+        sys.stdout.close()
+        sys.stdout = real_stdout
+
+    assert [r[0] for r in input_order_results] == [r[0] for r in longest_first_results], "Output order changed"
+
+    print(f"Story groups: {len(rows)}, workers: {args.workers}")
+    print(f"Input order makespan:   {input_order_time:.2f}s")
+    print(f"Longest-first makespan: {longest_first_time:.2f}s")
+    print(f"Improvement:            {(1 - longest_first_time / input_order_time) * 100:.1f}%")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+"""
+Offline stand-in for the OpenAI client used by the benchmarks.
+Replies are canned, and each call sleeps for a latency that grows with prompt size
+and the requested max_tokens, roughly like a real chat completion.
+"""
+
+import threading
+import time
+from types import SimpleNamespace
+
+class StubCompletions:
+    def __init__(self, base_latency=0.02, seconds_per_prompt_token=0.00005, seconds_per_completion_token=0.002, reply=None):
+        self.base_latency = base_latency
+        self.seconds_per_prompt_token = seconds_per_prompt_token
+        self.seconds_per_completion_token = seconds_per_completion_token
+        self.reply = reply
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def create(self, **request):
+        with self._lock:
+            self.calls += 1
+        prompt_tokens = sum(len(message["content"]) for message in request.get("messages", [])) // 4
+        completion_tokens = min(request.get("max_tokens", 100), 20 + prompt_tokens // 8)
+        time.sleep(self.base_latency
+                   + prompt_tokens * self.seconds_per_prompt_token
+                   + completion_tokens * self.seconds_per_completion_token)
+
+        content = self.reply(request) if callable(self.reply) else (self.reply or "Stub reply.")
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content=content), finish_reason="stop")],
+            usage=SimpleNamespace(prompt_tokens=prompt_tokens, completion_tokens=completion_tokens)
+        )
+
+class StubClient:
+    """
+    Drop-in for openai.OpenAI() exposing only chat.completions.create.
+    """
+    def __init__(self, **kwargs):
+        self.chat = SimpleNamespace(completions=StubCompletions(**kwargs))
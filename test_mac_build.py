@@ -43,19 +43,44 @@ def test_module_imports():
         "NewsSummariser",
         "NewsDigestor",
         "NewsToDocx",
-        # Country-specific modules
-        "FinlandNewsToCsv",
-        "FinlandNewsChainer", 
-        "FinlandNewsMerger",
-        "FinlandNewsSummariserThirdPass",
-        "FinlandNewsDigestor",
-        "FinlandNewsToDocx",
-        "PolandNewsToCsv",
-        "PolandNewsChainer",
-        "PolandNewsMerger", 
-        "PolandNewsSummariserThirdPass",
-        "PolandNewsDigestor",
-        "PolandNewsToDocx"
+        # Country profiles (categories, prompts, file names per country)
+        "NewsCountryProfiles",
+        # Streaming Word writer for very large digests
+        "NewsDocxStream",
+        # In-memory digest model and its Markdown, Word, HTML and text renderers
+        "NewsDocumentModel",
+        # Stage runner that skips pipeline stages whose inputs have not changed
+        "NewsPipeline",
+        # Content-addressed store of stage outputs shared across runs and machines
+        "NewsArtifactStore",
+        # Parallel multi-country runs sharing one LLM rate limiter
+        "NewsRateLimiter",
+        "NewsParallel",
+        # Per-item progress events with throughput and ETA
+        "NewsProgress",
+        # Cancel and pause/resume of a running pipeline
+        "NewsCancellation",
+        # Batched GUI log delivery with a bounded pane and a full log file
+        "NewsLogBuffer",
+        # Token and latency telemetry of LLM calls
+        "NewsTelemetry",
+        # Prompt compaction of article text
+        "NewsPrompts",
+        # Concurrent summarisation of story groups
+        "NewsScheduler",
+        # Reuse of summaries of near-identical earlier story groups
+        "NewsSummaryCache",
+        # Trained classifiers cached by training data fingerprint
+        "NewsModelCache",
+        # Naive Bayes scorer and keyword matcher behind digest categorisation
+        "NewsNBScorer",
+        "NewsKeywordMatcher",
+        # Shared text features for digest similarity
+        "NewsFeatures",
+        # Store of LLM and human category labels used for training
+        "NewsTrainingStore",
+        # Headless command-line entry point
+        "NewsProcessorCLI"
     ]
     
     failed_imports = []
@@ -148,6 +173,29 @@ def test_training_data():
         print(f"✅ All training data loaded successfully ({total_rows} total rows)")
         return True
 
+def test_cli_input_patterns():
+    """Test if CLI input patterns keep literal braces while expanding {name} and {tag}"""
+    from NewsCountryProfiles import load_profile
+    from NewsProcessorCLI import expand_inputs
+
+    profile = load_profile("Finland")
+    with tempfile.TemporaryDirectory() as folder:
+        news_dir = os.path.join(folder, "news {draft}")
+        os.makedirs(news_dir)
+        expected = os.path.join(news_dir, f"{profile.file_tag}_1.md")
+        Path(expected).touch()
+        try:
+            files = expand_inputs([os.path.join(news_dir, "{tag}_*.md")], profile)
+        except (KeyError, ValueError, IndexError) as e:
+            print(f"❌ Braced input path raised {type(e).__name__}: {e}")
+            return False
+
+    if files != [expected]:
+        print(f"❌ Expected {[expected]}, got {files}")
+        return False
+    print(f"✅ Braced input path expanded to {os.path.basename(expected)}")
+    return True
+
 def test_assets():
     """Test if required assets are present"""
     assets = [
@@ -181,6 +229,7 @@ def main():
         ("Module Imports", test_module_imports),
         ("Dependencies", test_dependencies),
         ("Training Data", test_training_data),
+        ("CLI Input Patterns", test_cli_input_patterns),
         ("Assets", test_assets)
     ]
     